@@ -2,8 +2,11 @@
 """Automated content scheduling for PeterMat social media."""
 
 import asyncio
+import json
 import random
+import sys
 from datetime import datetime, timedelta
+from itertools import accumulate
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -20,83 +23,86 @@ from social_video_automation.templates.content_formulas import (
 AEDT = ZoneInfo("Australia/Sydney")
 
 
-def get_next_posting_times(platform: str, days: int = 7) -> list[datetime]:
-    """Generate optimal posting times for the next N days."""
+def get_next_posting_times(
+    platform: str,
+    now: datetime,
+    day_offsets: list[timedelta],
+) -> list[datetime]:
+    """Generate optimal posting times for each day offset from now."""
     template = PLATFORM_TEMPLATES.get(platform, {})
     best_times = template.get("best_posting_times_aedt", ["12:00"])
     daily_posts = POSTING_SCHEDULE.get(platform, {}).get("daily", 1)
 
-    posting_times = []
-    now = datetime.now(AEDT)
-
-    for day_offset in range(days):
-        date = now + timedelta(days=day_offset)
-        times_to_use = best_times[:daily_posts]
+    base = now.replace(second=0, microsecond=0)
 
-        for time_str in times_to_use:
-            hour, minute = map(int, time_str.split(":"))
-            post_time = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            if post_time > now:
-                posting_times.append(post_time)
+    # Parse each posting time once and anchor it to today
+    candidates = []
+    for time_str in best_times[:daily_posts]:
+        hour, minute = map(int, time_str.split(":"))
+        candidates.append(base.replace(hour=hour, minute=minute))
 
-    return posting_times
+    return [
+        post_time
+        for offset in day_offsets
+        for candidate in candidates
+        if (post_time := candidate + offset) > now
+    ]
 
 
 def generate_content_calendar(days: int = 7) -> dict:
     """Generate a content calendar balancing all pillars."""
     calendar = {}
 
+    # Selection pools are fixed for the whole calendar, so build them once
+    pillar_keys = list(CONTENT_PILLARS.keys())
+    pillar_cum_weights = list(accumulate(p["weight"] for p in CONTENT_PILLARS.values()))
+    formula_keys = list(CONTENT_FORMULAS.keys())
+
+    # All platforms share the same clock reading and day offsets
+    now = datetime.now(AEDT)
+    day_offsets = [timedelta(days=day) for day in range(days)]
+
     for platform in PLATFORM_TEMPLATES:
-        calendar[platform] = []
-        posting_times = get_next_posting_times(platform, days)
-
-        for post_time in posting_times:
-            # Select content pillar based on weights
-            pillar = random.choices(
-                list(CONTENT_PILLARS.keys()),
-                weights=[p["weight"] for p in CONTENT_PILLARS.values()],
-            )[0]
-
-            # Select content type from pillar
-            content_type = random.choice(CONTENT_PILLARS[pillar]["types"])
-
-            # Select a formula
-            formula = random.choice(list(CONTENT_FORMULAS.keys()))
-
-            # Select a hook style
-            hook_category = random.choice(
-                PLATFORM_TEMPLATES[platform].get(
-                    "content_types", ["tutorial"]
-                )
-            )
+        posting_times = get_next_posting_times(platform, now, day_offsets)
 
-            calendar[platform].append({
+        # Draw every post's pillar and formula in one call each
+        n = len(posting_times)
+        pillars = random.choices(pillar_keys, cum_weights=pillar_cum_weights, k=n)
+        formulas = random.choices(formula_keys, k=n)
+
+        calendar[platform] = [
+            {
                 "scheduled_time": post_time.isoformat(),
                 "pillar": pillar,
-                "content_type": content_type,
+                # Content type depends on the pillar, so it is drawn per post
+                "content_type": random.choice(CONTENT_PILLARS[pillar]["types"]),
                 "formula": formula,
                 "status": "scheduled",
-            })
+            }
+            for post_time, pillar, formula in zip(posting_times, pillars, formulas, strict=True)
+        ]
 
     return calendar
 
 
 def print_calendar(calendar: dict) -> None:
     """Print calendar in readable format."""
-    print("\n" + "=" * 60)
-    print("PETERMAT CONTENT CALENDAR")
-    print("=" * 60)
+    lines = ["", "=" * 60, "PETERMAT CONTENT CALENDAR", "=" * 60]
 
     for platform, posts in calendar.items():
-        print(f"\n📱 {platform.upper()}")
-        print("-" * 40)
+        lines.append(f"\n📱 {platform.upper()}")
+        lines.append("-" * 40)
         for post in posts:
             time = datetime.fromisoformat(post["scheduled_time"])
-            print(f"  {time.strftime('%a %d %b %H:%M')}")
-            print(f"    Pillar: {post['pillar']}")
-            print(f"    Type: {post['content_type']}")
-            print(f"    Formula: {post['formula']}")
-            print()
+            lines.append(
+                f"  {time.strftime('%a %d %b %H:%M')}\n"
+                f"    Pillar: {post['pillar']}\n"
+                f"    Type: {post['content_type']}\n"
+                f"    Formula: {post['formula']}\n"
+            )
+
+    # One write for the whole calendar instead of a print per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def main():
@@ -109,13 +115,19 @@ async def main():
     output_dir = Path(__file__).parent.parent / "calendars"
     output_dir.mkdir(exist_ok=True)
 
-    import json
     output_file = output_dir / f"calendar_{datetime.now().strftime('%Y%m%d')}.json"
-    with open(output_file, "w") as f:
-        json.dump(calendar, f, indent=2, default=str)
+    output_file.write_text(json.dumps(calendar, indent=2, default=str))
 
     print(f"\n✅ Calendar saved to: {output_file}")
 
 
 if __name__ == "__main__":
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     asyncio.run(main())
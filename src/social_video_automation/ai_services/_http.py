@@ -0,0 +1,25 @@
+"""Shared HTTP connection pool for OpenAI-compatible AI services."""
+
+import httpx
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP/2 client shared by ChatGPT and Grok."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(600.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _shared_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
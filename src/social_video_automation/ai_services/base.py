@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 
@@ -14,9 +15,22 @@ class ContentType(str, Enum):
     HASHTAGS = "hashtags"
     THUMBNAIL_PROMPT = "thumbnail_prompt"
     CONTENT_IDEA = "content_idea"
+    VIDEO_PACKAGE = "video_package"  # JSON object with script, caption, hashtags, thumbnail
 
 
-@dataclass
+# Content types bundled into a single VIDEO_PACKAGE response, in output order
+VIDEO_PACKAGE_FIELDS = (
+    ContentType.VIDEO_SCRIPT,
+    ContentType.CAPTION,
+    ContentType.HASHTAGS,
+    ContentType.THUMBNAIL_PROMPT,
+)
+
+# Output token limit for a request without max_length
+DEFAULT_MAX_TOKENS = 1000
+
+
+@dataclass(slots=True)
 class ContentRequest:
     """Request for AI-generated content."""
 
@@ -28,8 +42,17 @@ class ContentRequest:
     style_hints: list[str] = field(default_factory=list)
     additional_context: str = ""
 
+    @property
+    def max_tokens(self) -> int:
+        """Output token limit; a VIDEO_PACKAGE gets the default for each of its fields."""
+        if self.max_length:
+            return self.max_length
+        if self.content_type == ContentType.VIDEO_PACKAGE:
+            return DEFAULT_MAX_TOKENS * len(VIDEO_PACKAGE_FIELDS)
+        return DEFAULT_MAX_TOKENS
+
 
-@dataclass
+@dataclass(slots=True)
 class ContentResponse:
     """Response from AI content generation."""
 
@@ -55,25 +78,47 @@ class AIService(ABC):
         """Check if the service is available and configured."""
         pass
 
+    async def ping(self) -> bool:
+        """Probe the service with a live request.
+
+        Defaults to the configuration check; services with a cheap health
+        endpoint override this.
+        """
+        return await self.is_available()
+
     def _build_brand_prompt(self, brand_context: dict[str, Any]) -> str:
         """Build brand-specific prompt context."""
-        brand_name = brand_context.get("name", "PeterMat")
-        tagline = brand_context.get("tagline", "Born from the land. Built for performance.")
-        tone = brand_context.get("tone", ["professional", "sporty", "australian"])
+        return _format_brand_prompt(
+            brand_context.get("name", "PeterMat"),
+            brand_context.get("tagline", "Born from the land. Built for performance."),
+            tuple(brand_context.get("tone", ["professional", "sporty", "australian"])),
+        )
 
-        return f"""
+    def _build_platform_context(self, platform: str) -> str:
+        """Build platform-specific context."""
+        return _format_platform_context(platform)
+
+
+_PLATFORM_CONTEXTS = {
+    "instagram": "Instagram Reels: Short, engaging, visually striking. Use trending audio cues. 15-60 seconds.",
+    "tiktok": "TikTok: Fast-paced, trend-aware, authentic. Hook in first 2 seconds. 15-60 seconds.",
+    "youtube": "YouTube Shorts: Educational or entertaining. Clear value proposition. Up to 60 seconds.",
+    "facebook": "Facebook Reels: Broader audience, slightly longer form acceptable. 15-90 seconds.",
+}
+
+
+@lru_cache(maxsize=32)
+def _format_brand_prompt(brand_name: str, tagline: str, tone: tuple[str, ...]) -> str:
+    """Format the brand prompt; cached because brand settings rarely change."""
+    return f"""
 Brand: {brand_name}
 Tagline: "{tagline}"
 Tone: {', '.join(tone)}
 Focus: Australian sporting excellence, quality craftsmanship, authentic Australian experience
 """
 
-    def _build_platform_context(self, platform: str) -> str:
-        """Build platform-specific context."""
-        contexts = {
-            "instagram": "Instagram Reels: Short, engaging, visually striking. Use trending audio cues. 15-60 seconds.",
-            "tiktok": "TikTok: Fast-paced, trend-aware, authentic. Hook in first 2 seconds. 15-60 seconds.",
-            "youtube": "YouTube Shorts: Educational or entertaining. Clear value proposition. Up to 60 seconds.",
-            "facebook": "Facebook Reels: Broader audience, slightly longer form acceptable. 15-90 seconds.",
-        }
-        return contexts.get(platform, "General social media video content.")
+
+@lru_cache(maxsize=16)
+def _format_platform_context(platform: str) -> str:
+    """Look up the platform context string."""
+    return _PLATFORM_CONTEXTS.get(platform, "General social media video content.")
@@ -1,8 +1,12 @@
 """ChatGPT (OpenAI) service for content generation."""
 
+from typing import Any
+
+import httpx
 import structlog
 from openai import AsyncOpenAI
 
+from social_video_automation.ai_services._http import get_http_client
 from social_video_automation.ai_services.base import (
     AIService,
     ContentRequest,
@@ -13,6 +17,38 @@ from social_video_automation.config import get_settings
 
 logger = structlog.get_logger()
 
+_CONTENT_TYPE_INSTRUCTIONS: dict[ContentType, str] = {
+    ContentType.VIDEO_SCRIPT: """
+You are a creative video script writer for social media. Write engaging, concise scripts
+that capture attention immediately. Include visual cues and timing suggestions.
+Format: [VISUAL] description | [AUDIO/VO] narration | [TEXT] on-screen text
+""",
+    ContentType.CAPTION: """
+You are a social media caption writer. Write engaging captions that drive engagement.
+Include a hook, value, and call-to-action. Keep it authentic and on-brand.
+""",
+    ContentType.HASHTAGS: """
+You are a hashtag strategist. Generate relevant, trending hashtags that maximize reach
+while staying authentic to the brand. Mix popular and niche hashtags.
+""",
+    ContentType.THUMBNAIL_PROMPT: """
+You are an AI image prompt engineer. Create detailed prompts for AI image generation
+that will create compelling video thumbnails. Be specific about composition and style.
+""",
+    ContentType.CONTENT_IDEA: """
+You are a content strategist. Generate creative, engaging content ideas that align
+with current trends while staying true to the brand voice.
+""",
+    ContentType.VIDEO_PACKAGE: """
+You are a social media content producer. Create a complete video content package and
+respond with a single JSON object with these string fields:
+- "video_script": engaging script formatted as [VISUAL] description | [AUDIO/VO] narration | [TEXT] on-screen text
+- "caption": caption with a hook, value, and call-to-action
+- "hashtags": space-separated hashtags mixing popular and niche tags
+- "thumbnail_prompt": detailed AI image prompt for a compelling video thumbnail
+""",
+}
+
 
 class ChatGPTService(AIService):
     """ChatGPT service using OpenAI API."""
@@ -22,16 +58,30 @@ class ChatGPTService(AIService):
     def __init__(self) -> None:
         self.settings = get_settings()
         self._client: AsyncOpenAI | None = None
+        self._http_client: httpx.AsyncClient | None = None
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Lazy-loaded OpenAI client."""
-        if self._client is None:
-            self._client = AsyncOpenAI(api_key=self.settings.ai.openai_api_key)
+        """Lazy-loaded OpenAI client.
+
+        Rebuilt when the shared HTTP client is replaced, e.g. after it was closed.
+        """
+        http_client = get_http_client()
+        if self._client is None or self._http_client is not http_client:
+            self._client = AsyncOpenAI(
+                api_key=self.settings.ai.openai_api_key,
+                # openai annotates httpx2.AsyncClient but also accepts httpx clients
+                http_client=http_client,  # type: ignore[arg-type]
+            )
+            self._http_client = http_client
         return self._client
 
     async def is_available(self) -> bool:
-        """Check if ChatGPT service is available."""
+        """Check if ChatGPT service is configured."""
+        return bool(self.settings.ai.openai_api_key)
+
+    async def ping(self) -> bool:
+        """Probe the ChatGPT API with a live request."""
         if not self.settings.ai.openai_api_key:
             return False
         try:
@@ -46,28 +96,57 @@ class ChatGPTService(AIService):
         system_prompt = self._build_system_prompt(request)
         user_prompt = self._build_user_prompt(request)
 
-        response = await self.client.chat.completions.create(
+        extra_args: dict = {}
+        if request.content_type == ContentType.VIDEO_PACKAGE:
+            extra_args["response_format"] = {"type": "json_object"}
+
+        stream = await self.client.chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            max_tokens=request.max_length or 1000,
+            max_tokens=request.max_tokens,
             temperature=0.7,
+            stream=True,
+            stream_options={"include_usage": True},
+            **extra_args,
         )
 
-        content = response.choices[0].message.content or ""
-        tokens_used = response.usage.total_tokens if response.usage else 0
+        # Stop reading once max_length characters have arrived
+        parts: list[str] = []
+        length = 0
+        tokens_used = 0
+        truncated = False
+        try:
+            async for chunk in stream:
+                if chunk.usage:
+                    tokens_used = chunk.usage.total_tokens
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                parts.append(delta)
+                length += len(delta)
+                if request.max_length and length >= request.max_length:
+                    truncated = True
+                    break
+        finally:
+            await stream.close()
+
+        metadata: dict[str, Any] = {
+            "model": "gpt-4o",
+            "platform": request.platform,
+        }
+        if truncated:
+            # Usage is only sent in the final chunk, so tokens_used is unknown
+            metadata["truncated"] = True
 
         return ContentResponse(
-            content=content,
+            content="".join(parts)[: request.max_length],
             content_type=request.content_type,
             ai_service=self.service_name,
             tokens_used=tokens_used,
-            metadata={
-                "model": "gpt-4o",
-                "platform": request.platform,
-            },
+            metadata=metadata,
         )
 
     def _build_system_prompt(self, request: ContentRequest) -> str:
@@ -75,36 +154,13 @@ class ChatGPTService(AIService):
         brand_context = self._build_brand_prompt(request.brand_context)
         platform_context = self._build_platform_context(request.platform)
 
-        content_type_instructions = {
-            ContentType.VIDEO_SCRIPT: """
-You are a creative video script writer for social media. Write engaging, concise scripts
-that capture attention immediately. Include visual cues and timing suggestions.
-Format: [VISUAL] description | [AUDIO/VO] narration | [TEXT] on-screen text
-""",
-            ContentType.CAPTION: """
-You are a social media caption writer. Write engaging captions that drive engagement.
-Include a hook, value, and call-to-action. Keep it authentic and on-brand.
-""",
-            ContentType.HASHTAGS: """
-You are a hashtag strategist. Generate relevant, trending hashtags that maximize reach
-while staying authentic to the brand. Mix popular and niche hashtags.
-""",
-            ContentType.THUMBNAIL_PROMPT: """
-You are an AI image prompt engineer. Create detailed prompts for AI image generation
-that will create compelling video thumbnails. Be specific about composition and style.
-""",
-            ContentType.CONTENT_IDEA: """
-You are a content strategist. Generate creative, engaging content ideas that align
-with current trends while staying true to the brand voice.
-""",
-        }
-
+        # Static brand/platform text leads so providers can reuse the cached prefix
         return f"""
-{content_type_instructions.get(request.content_type, "")}
-
 {brand_context}
 
 Platform Context: {platform_context}
+
+{_CONTENT_TYPE_INSTRUCTIONS.get(request.content_type, "")}
 """
 
     def _build_user_prompt(self, request: ContentRequest) -> str:
@@ -13,6 +13,72 @@ from social_video_automation.config import get_settings
 
 logger = structlog.get_logger()
 
+_CONTENT_TYPE_INSTRUCTIONS: dict[ContentType, str] = {
+    ContentType.VIDEO_SCRIPT: """
+Create an engaging video script for social media. The script should:
+- Hook viewers in the first 2 seconds
+- Include visual direction in [VISUAL] tags
+- Include voiceover/audio in [AUDIO] tags
+- Include on-screen text in [TEXT] tags
+- Be optimized for the target platform
+""",
+    ContentType.CAPTION: """
+Write an engaging social media caption that:
+- Starts with a compelling hook
+- Provides value or entertainment
+- Ends with a call-to-action
+- Feels authentic and on-brand
+""",
+    ContentType.HASHTAGS: """
+Generate a strategic mix of hashtags:
+- 3-5 highly popular hashtags (1M+ posts)
+- 5-7 medium hashtags (100K-1M posts)
+- 3-5 niche hashtags (10K-100K posts)
+- All relevant to the content and brand
+""",
+    ContentType.THUMBNAIL_PROMPT: """
+Create a detailed AI image generation prompt for a video thumbnail:
+- Describe composition, colors, and style
+- Include text overlay suggestions
+- Make it visually striking and clickable
+- Match the brand aesthetic
+""",
+    ContentType.CONTENT_IDEA: """
+Generate creative content ideas that:
+- Align with current social media trends
+- Match the brand voice and values
+- Have viral potential
+- Are practical to execute
+""",
+    ContentType.VIDEO_PACKAGE: """
+Create a complete video content package. Respond with a JSON object containing:
+- "video_script": script with [VISUAL], [AUDIO] and [TEXT] tags, hooking viewers in 2 seconds
+- "caption": caption with a compelling hook, value, and call-to-action
+- "hashtags": space-separated mix of popular, medium and niche hashtags
+- "thumbnail_prompt": detailed AI image prompt for a striking, on-brand thumbnail
+""",
+}
+
+# Static prompt layout; only the per-request fields are filled in at call time.
+# Brand and platform context lead so the provider can reuse the cached prefix.
+_PROMPT_TEMPLATE = """
+BRAND CONTEXT:
+{brand_context}
+
+PLATFORM: {platform}
+{platform_context}
+
+{instructions}
+
+TOPIC: {topic}
+
+{style_line}
+{context_line}
+{length_line}
+
+Generate the {content_type} now:
+"""
+
 
 class GeminiService(AIService):
     """Gemini service using Google AI API."""
@@ -53,11 +119,16 @@ class GeminiService(AIService):
         """Generate content using Gemini."""
         prompt = self._build_full_prompt(request)
 
+        extra_args: dict = {}
+        if request.content_type == ContentType.VIDEO_PACKAGE:
+            extra_args["response_mime_type"] = "application/json"
+
         response = await self.model.generate_content_async(
             prompt,
             generation_config=genai.GenerationConfig(
-                max_output_tokens=request.max_length or 1000,
+                max_output_tokens=request.max_tokens,
                 temperature=0.7,
+                **extra_args,
             ),
         )
 
@@ -79,59 +150,20 @@ class GeminiService(AIService):
         brand_context = self._build_brand_prompt(request.brand_context)
         platform_context = self._build_platform_context(request.platform)
 
-        content_type_instructions = {
-            ContentType.VIDEO_SCRIPT: """
-Create an engaging video script for social media. The script should:
-- Hook viewers in the first 2 seconds
-- Include visual direction in [VISUAL] tags
-- Include voiceover/audio in [AUDIO] tags
-- Include on-screen text in [TEXT] tags
-- Be optimized for the target platform
-""",
-            ContentType.CAPTION: """
-Write an engaging social media caption that:
-- Starts with a compelling hook
-- Provides value or entertainment
-- Ends with a call-to-action
-- Feels authentic and on-brand
-""",
-            ContentType.HASHTAGS: """
-Generate a strategic mix of hashtags:
-- 3-5 highly popular hashtags (1M+ posts)
-- 5-7 medium hashtags (100K-1M posts)
-- 3-5 niche hashtags (10K-100K posts)
-- All relevant to the content and brand
-""",
-            ContentType.THUMBNAIL_PROMPT: """
-Create a detailed AI image generation prompt for a video thumbnail:
-- Describe composition, colors, and style
-- Include text overlay suggestions
-- Make it visually striking and clickable
-- Match the brand aesthetic
-""",
-            ContentType.CONTENT_IDEA: """
-Generate creative content ideas that:
-- Align with current social media trends
-- Match the brand voice and values
-- Have viral potential
-- Are practical to execute
-""",
-        }
-
-        return f"""
-{content_type_instructions.get(request.content_type, "Generate creative content.")}
-
-BRAND CONTEXT:
-{brand_context}
-
-PLATFORM: {request.platform}
-{platform_context}
-
-TOPIC: {request.topic}
-
-{f"STYLE: {', '.join(request.style_hints)}" if request.style_hints else ""}
-{f"ADDITIONAL CONTEXT: {request.additional_context}" if request.additional_context else ""}
-{f"MAX LENGTH: {request.max_length} characters" if request.max_length else ""}
-
-Generate the {request.content_type.value} now:
-"""
+        return _PROMPT_TEMPLATE.format(
+            instructions=_CONTENT_TYPE_INSTRUCTIONS.get(
+                request.content_type, "Generate creative content."
+            ),
+            brand_context=brand_context,
+            platform=request.platform,
+            platform_context=platform_context,
+            topic=request.topic,
+            style_line=f"STYLE: {', '.join(request.style_hints)}" if request.style_hints else "",
+            context_line=(
+                f"ADDITIONAL CONTEXT: {request.additional_context}"
+                if request.additional_context
+                else ""
+            ),
+            length_line=f"MAX LENGTH: {request.max_length} characters" if request.max_length else "",
+            content_type=request.content_type.value,
+        )
@@ -1,8 +1,12 @@
 """xAI Grok service for content generation."""
 
+from typing import Any
+
+import httpx
 import structlog
 from openai import AsyncOpenAI
 
+from social_video_automation.ai_services._http import get_http_client
 from social_video_automation.ai_services.base import (
     AIService,
     ContentRequest,
@@ -13,6 +17,42 @@ from social_video_automation.config import get_settings
 
 logger = structlog.get_logger()
 
+# Grok has a more conversational, slightly edgy personality
+_CONTENT_TYPE_INSTRUCTIONS: dict[ContentType, str] = {
+    ContentType.VIDEO_SCRIPT: """
+You're creating video scripts for social media. Be bold, authentic, and engaging.
+Hook viewers immediately - no slow intros. Keep it punchy and memorable.
+Format: [VISUAL] | [AUDIO] | [TEXT ON SCREEN]
+""",
+    ContentType.CAPTION: """
+Write captions that cut through the noise. Be authentic, slightly bold, but professional.
+Start strong, deliver value, end with action. No fluff.
+""",
+    ContentType.HASHTAGS: """
+Generate hashtags that actually work. Mix trending with niche.
+Skip the generic garbage - focus on what drives real engagement.
+""",
+    ContentType.THUMBNAIL_PROMPT: """
+Create an image prompt that demands attention. Be specific about:
+- Composition and focal point
+- Color psychology
+- Text placement
+- Emotional impact
+""",
+    ContentType.CONTENT_IDEA: """
+Generate content ideas that stand out. Think about what makes people stop scrolling.
+Be creative but practical. Trends matter but authenticity matters more.
+""",
+    ContentType.VIDEO_PACKAGE: """
+Put together a full video package that stops the scroll. Respond with one JSON object
+with these string fields:
+- "video_script": punchy script, format [VISUAL] | [AUDIO] | [TEXT ON SCREEN]
+- "caption": starts strong, delivers value, ends with action
+- "hashtags": space-separated hashtags, trending mixed with niche
+- "thumbnail_prompt": attention-grabbing image prompt (composition, colour, text, emotion)
+""",
+}
+
 
 class GrokService(AIService):
     """Grok service using xAI API (OpenAI-compatible)."""
@@ -22,19 +62,31 @@ class GrokService(AIService):
     def __init__(self) -> None:
         self.settings = get_settings()
         self._client: AsyncOpenAI | None = None
+        self._http_client: httpx.AsyncClient | None = None
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Lazy-loaded xAI client (OpenAI-compatible)."""
-        if self._client is None:
+        """Lazy-loaded xAI client (OpenAI-compatible).
+
+        Rebuilt when the shared HTTP client is replaced, e.g. after it was closed.
+        """
+        http_client = get_http_client()
+        if self._client is None or self._http_client is not http_client:
             self._client = AsyncOpenAI(
                 api_key=self.settings.ai.xai_api_key,
                 base_url="https://api.x.ai/v1",
+                # openai annotates httpx2.AsyncClient but also accepts httpx clients
+                http_client=http_client,  # type: ignore[arg-type]
             )
+            self._http_client = http_client
         return self._client
 
     async def is_available(self) -> bool:
-        """Check if Grok service is available."""
+        """Check if Grok service is configured."""
+        return bool(self.settings.ai.xai_api_key)
+
+    async def ping(self) -> bool:
+        """Probe the Grok API with a live request."""
         if not self.settings.ai.xai_api_key:
             return False
         try:
@@ -49,28 +101,57 @@ class GrokService(AIService):
         system_prompt = self._build_system_prompt(request)
         user_prompt = self._build_user_prompt(request)
 
-        response = await self.client.chat.completions.create(
+        extra_args: dict = {}
+        if request.content_type == ContentType.VIDEO_PACKAGE:
+            extra_args["response_format"] = {"type": "json_object"}
+
+        stream = await self.client.chat.completions.create(
             model="grok-3",
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            max_tokens=request.max_length or 1000,
+            max_tokens=request.max_tokens,
             temperature=0.7,
+            stream=True,
+            stream_options={"include_usage": True},
+            **extra_args,
         )
 
-        content = response.choices[0].message.content or ""
-        tokens_used = response.usage.total_tokens if response.usage else 0
+        # Stop reading once max_length characters have arrived
+        parts: list[str] = []
+        length = 0
+        tokens_used = 0
+        truncated = False
+        try:
+            async for chunk in stream:
+                if chunk.usage:
+                    tokens_used = chunk.usage.total_tokens
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                parts.append(delta)
+                length += len(delta)
+                if request.max_length and length >= request.max_length:
+                    truncated = True
+                    break
+        finally:
+            await stream.close()
+
+        metadata: dict[str, Any] = {
+            "model": "grok-3",
+            "platform": request.platform,
+        }
+        if truncated:
+            # Usage is only sent in the final chunk, so tokens_used is unknown
+            metadata["truncated"] = True
 
         return ContentResponse(
-            content=content,
+            content="".join(parts)[: request.max_length],
             content_type=request.content_type,
             ai_service=self.service_name,
             tokens_used=tokens_used,
-            metadata={
-                "model": "grok-3",
-                "platform": request.platform,
-            },
+            metadata=metadata,
         )
 
     def _build_system_prompt(self, request: ContentRequest) -> str:
@@ -78,42 +159,15 @@ class GrokService(AIService):
         brand_context = self._build_brand_prompt(request.brand_context)
         platform_context = self._build_platform_context(request.platform)
 
-        # Grok has a more conversational, slightly edgy personality
-        content_type_instructions = {
-            ContentType.VIDEO_SCRIPT: """
-You're creating video scripts for social media. Be bold, authentic, and engaging.
-Hook viewers immediately - no slow intros. Keep it punchy and memorable.
-Format: [VISUAL] | [AUDIO] | [TEXT ON SCREEN]
-""",
-            ContentType.CAPTION: """
-Write captions that cut through the noise. Be authentic, slightly bold, but professional.
-Start strong, deliver value, end with action. No fluff.
-""",
-            ContentType.HASHTAGS: """
-Generate hashtags that actually work. Mix trending with niche.
-Skip the generic garbage - focus on what drives real engagement.
-""",
-            ContentType.THUMBNAIL_PROMPT: """
-Create an image prompt that demands attention. Be specific about:
-- Composition and focal point
-- Color psychology
-- Text placement
-- Emotional impact
-""",
-            ContentType.CONTENT_IDEA: """
-Generate content ideas that stand out. Think about what makes people stop scrolling.
-Be creative but practical. Trends matter but authenticity matters more.
-""",
-        }
-
+        # Static brand/platform text leads so providers can reuse the cached prefix
         return f"""
-{content_type_instructions.get(request.content_type, "Generate compelling content.")}
-
 {brand_context}
 
 Platform: {platform_context}
 
 Be authentic to the Australian sporting brand identity. Quality, performance, the land.
+
+{_CONTENT_TYPE_INSTRUCTIONS.get(request.content_type, "Generate compelling content.")}
 """
 
     def _build_user_prompt(self, request: ContentRequest) -> str:
@@ -1,31 +1,69 @@
 """AI Orchestrator - Coordinates multiple AI services for content generation."""
 
 import asyncio
+import itertools
+import json
 import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
 from enum import Enum
+from typing import TypeVar
 
 import structlog
 
 from social_video_automation.ai_services.base import (
+    VIDEO_PACKAGE_FIELDS,
     AIService,
     ContentRequest,
     ContentResponse,
+    ContentType,
 )
 from social_video_automation.ai_services.chatgpt import ChatGPTService
 from social_video_automation.ai_services.gemini import GeminiService
 from social_video_automation.ai_services.grok import GrokService
+from social_video_automation.config import get_settings
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
+# A selection strategy: (request, available service names) -> response(s)
+_StrategyFn = Callable[
+    [ContentRequest, list[str]], Awaitable[ContentResponse | list[ContentResponse]]
+]
+
+
+async def _safe(coro: Awaitable[T]) -> T | Exception:
+    """Await a fan-out member, returning its exception instead of raising.
+
+    Unlike ``gather(return_exceptions=True)`` this only captures ``Exception``,
+    so cancelling the caller still cancels every member.
+    """
+    try:
+        return await coro
+    except Exception as e:
+        return e
+
+
+def _default_brand_context() -> dict:
+    """Build the brand context from settings."""
+    settings = get_settings()
+    return {
+        "name": settings.brand.name,
+        "tagline": settings.brand.tagline,
+        "tone": settings.brand.tone,
+    }
+
 
 class SelectionStrategy(str, Enum):
     """Strategy for selecting which AI service to use."""
 
     ROUND_ROBIN = "round_robin"  # Rotate between services
     RANDOM = "random"  # Random selection
-    PRIORITY = "priority"  # Use first available in priority order
+    PRIORITY = "priority"  # Priority order, next service only on failure or hedge delay
     ENSEMBLE = "ensemble"  # Get responses from all and pick best
     PARALLEL = "parallel"  # Get all responses and return all
+    FASTEST = "fastest"  # Race all services and return the first success
 
 
 class AIOrchestrator:
@@ -38,14 +76,74 @@ class AIOrchestrator:
             "grok": GrokService(),
         }
         self._priority_order = ["chatgpt", "gemini", "grok"]
-        self._round_robin_index = 0
+        self._rr_services: tuple[str, ...] = ()
+        self._rr_cycle: Iterator[str] = iter(())
+        self._avail_cache: tuple[float, list[str]] | None = None
+        self._avail_ttl = 300.0
+        # Eviction probes started after a successful response, kept referenced until done
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        # Backpressure against provider rate limits, shared by every service call
+        self._request_sem = asyncio.Semaphore(get_settings().ai.max_concurrent_requests)
+        self._hedge_delay = get_settings().ai.priority_hedge_delay
+        self._strategies: dict[SelectionStrategy, _StrategyFn] = {
+            SelectionStrategy.PRIORITY: self._priority_generate,
+            SelectionStrategy.ROUND_ROBIN: self._round_robin_generate,
+            SelectionStrategy.RANDOM: self._random_generate,
+            SelectionStrategy.ENSEMBLE: self._ensemble_generate,
+            SelectionStrategy.PARALLEL: self._parallel_generate,
+            SelectionStrategy.FASTEST: self._fastest_generate,
+        }
+
+    def invalidate_availability(self) -> None:
+        """Drop the cached availability so the next call re-checks services."""
+        self._avail_cache = None
+
+    async def _handle_service_failures(self, service_names: list[str]) -> None:
+        """Live-probe failed services concurrently and drop any that are down from the cache."""
+        if not service_names or self._avail_cache is None:
+            return
+        alive = await asyncio.gather(*(_safe(self.services[n].ping()) for n in service_names))
+        down = {name for name, ok in zip(service_names, alive, strict=True) if ok is not True}
+        if down and self._avail_cache is not None:
+            checked_at, cached = self._avail_cache
+            self._avail_cache = (checked_at, [name for name in cached if name not in down])
+
+    def _handle_service_failures_later(self, service_names: list[str]) -> None:
+        """Run ``_handle_service_failures`` in a background task.
+
+        Used once a response is in hand so a hung ping cannot delay returning it.
+        """
+        if not service_names:
+            return
+        task = asyncio.create_task(self._handle_service_failures(service_names))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def ping_services(self) -> list[str]:
+        """Live-probe every service and refresh the availability cache with the result."""
+        checks = await asyncio.gather(*(_safe(s.ping()) for s in self.services.values()))
+        available = [name for name, ok in zip(self.services, checks, strict=True) if ok is True]
+        self._avail_cache = (time.monotonic(), available)
+        return list(available)
+
+    async def _call_service(self, service: AIService, request: ContentRequest) -> ContentResponse:
+        """Generate with one service, bounded by the request semaphore."""
+        async with self._request_sem:
+            return await service.generate_content(request)
 
     async def get_available_services(self) -> list[str]:
-        """Get list of available (configured and working) services."""
+        """Get list of available (configured and working) services.
+
+        Results are cached for ``_avail_ttl`` seconds.
+        """
+        if self._avail_cache is not None:
+            checked_at, cached = self._avail_cache
+            if time.monotonic() - checked_at < self._avail_ttl:
+                return list(cached)
+
         available = []
         checks = await asyncio.gather(
-            *[service.is_available() for service in self.services.values()],
-            return_exceptions=True,
+            *[_safe(service.is_available()) for service in self.services.values()]
         )
 
         for name, is_available in zip(self.services.keys(), checks):
@@ -53,7 +151,8 @@ class AIOrchestrator:
                 available.append(name)
 
         logger.info("Available AI services", services=available)
-        return available
+        self._avail_cache = (time.monotonic(), available)
+        return list(available)
 
     async def generate_content(
         self,
@@ -64,45 +163,104 @@ class AIOrchestrator:
         """Generate content using the specified strategy."""
         available = await self.get_available_services()
 
+        # An available preferred service skips strategy selection
+        if preferred_service in available:
+            return await self._call_service(self.services[preferred_service], request)
+
         if not available:
             raise RuntimeError("No AI services available. Check API key configuration.")
 
-        if preferred_service and preferred_service in available:
-            return await self.services[preferred_service].generate_content(request)
-
-        match strategy:
-            case SelectionStrategy.PRIORITY:
-                return await self._priority_generate(request, available)
-            case SelectionStrategy.ROUND_ROBIN:
-                return await self._round_robin_generate(request, available)
-            case SelectionStrategy.RANDOM:
-                return await self._random_generate(request, available)
-            case SelectionStrategy.ENSEMBLE:
-                return await self._ensemble_generate(request, available)
-            case SelectionStrategy.PARALLEL:
-                return await self._parallel_generate(request, available)
+        return await self._strategies[strategy](request, available)
 
     async def _priority_generate(
         self, request: ContentRequest, available: list[str]
     ) -> ContentResponse:
-        """Generate using first available service in priority order."""
-        for service_name in self._priority_order:
-            if service_name in available:
-                logger.info("Using priority service", service=service_name)
-                return await self.services[service_name].generate_content(request)
+        """Generate using services in priority order, hedging slow ones.
+
+        The next service is only started once every running one has failed or
+        ``_hedge_delay`` seconds pass without a response.
+        """
+        ordered = [name for name in self._priority_order if name in available]
+        ordered += [name for name in available if name not in ordered]
+        return await self._race(request, ordered, hedge_delay=self._hedge_delay)
+
+    async def _fastest_generate(
+        self, request: ContentRequest, available: list[str]
+    ) -> ContentResponse:
+        """Generate using whichever available service responds first."""
+        return await self._race(request, available)
 
-        # Fallback to any available
-        service_name = available[0]
-        return await self.services[service_name].generate_content(request)
+    async def _race(
+        self,
+        request: ContentRequest,
+        service_names: list[str],
+        hedge_delay: float | None = None,
+    ) -> ContentResponse:
+        """Run services concurrently and return the first successful response.
+
+        Without ``hedge_delay`` every service starts at once. With it, services
+        start one at a time in order: the next one starts when a running one
+        fails or ``hedge_delay`` seconds pass with no result. Remaining requests
+        are cancelled once a winner is found. Ties within one wake-up are broken
+        by the order of ``service_names``.
+        """
+        waiting = list(service_names)
+        tasks: dict[asyncio.Task[ContentResponse], str] = {}
+        rank: dict[asyncio.Task[ContentResponse], int] = {}
+        pending: set[asyncio.Task[ContentResponse]] = set()
+        failed: list[str] = []
+
+        def start_next() -> None:
+            name = waiting.pop(0)
+            task = asyncio.create_task(self._call_service(self.services[name], request))
+            tasks[task] = name
+            rank[task] = len(rank)
+            pending.add(task)
+
+        start_next()
+        while waiting and hedge_delay is None:
+            start_next()
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=hedge_delay if waiting else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    logger.info("Hedging slow service", service=waiting[0])
+                    start_next()
+                    continue
+                for task in sorted(done, key=rank.__getitem__):
+                    service_name = tasks[task]
+                    error = task.exception()
+                    if error is None:
+                        logger.info("Using fastest service", service=service_name)
+                        self._handle_service_failures_later(failed)
+                        return task.result()
+                    logger.warning("Service failed", service=service_name, error=str(error))
+                    failed.append(service_name)
+                    if waiting:
+                        start_next()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        await self._handle_service_failures(failed)
+        raise RuntimeError("All AI services failed to generate content")
 
     async def _round_robin_generate(
         self, request: ContentRequest, available: list[str]
     ) -> ContentResponse:
         """Generate using round-robin selection."""
-        service_name = available[self._round_robin_index % len(available)]
-        self._round_robin_index += 1
+        services = tuple(available)
+        if services != self._rr_services:
+            self._rr_services = services
+            self._rr_cycle = itertools.cycle(services)
+        service_name = next(self._rr_cycle)
         logger.info("Using round-robin service", service=service_name)
-        return await self.services[service_name].generate_content(request)
+        return await self._call_service(self.services[service_name], request)
 
     async def _random_generate(
         self, request: ContentRequest, available: list[str]
@@ -110,21 +268,56 @@ class AIOrchestrator:
         """Generate using random selection."""
         service_name = random.choice(available)
         logger.info("Using random service", service=service_name)
-        return await self.services[service_name].generate_content(request)
+        return await self._call_service(self.services[service_name], request)
 
     async def _ensemble_generate(
         self, request: ContentRequest, available: list[str]
     ) -> ContentResponse:
-        """Generate using all services and pick the best response."""
-        responses = await self._parallel_generate(request, available)
+        """Generate using all services and pick the best response.
+
+        The best response is tracked as each service finishes. Once one reaches
+        ``request.max_length`` the remaining services are cancelled.
+        """
+        tasks = {
+            asyncio.create_task(self._call_service(self.services[name], request)): name
+            for name in available
+        }
+        pending = set(tasks)
+        failed: list[str] = []
+        best: ContentResponse | None = None
+        best_length = -1
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        logger.warning("Service failed", service=tasks[task], error=str(error))
+                        failed.append(tasks[task])
+                        continue
+
+                    # For now, pick the longest response as "best"
+                    # Could be enhanced with quality scoring
+                    response = task.result()
+                    if len(response.content) > best_length:
+                        best, best_length = response, len(response.content)
+
+                if request.max_length and best_length >= request.max_length:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if best is None:
+            await self._handle_service_failures(failed)
+            raise RuntimeError("All AI services failed to generate content")
+        self._handle_service_failures_later(failed)
 
-        # For now, pick the longest response as "best"
-        # Could be enhanced with quality scoring
-        best = max(responses, key=lambda r: len(r.content))
         logger.info(
             "Ensemble selected best response",
             service=best.ai_service,
-            length=len(best.content),
+            length=best_length,
         )
         return best
 
@@ -133,21 +326,25 @@ class AIOrchestrator:
     ) -> list[ContentResponse]:
         """Generate using all available services in parallel."""
         tasks = [
-            self.services[name].generate_content(request)
+            _safe(self._call_service(self.services[name], request))
             for name in available
         ]
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks)
 
         responses = []
-        for name, result in zip(available, results):
+        failed = []
+        for name, result in zip(available, results, strict=True):
             if isinstance(result, ContentResponse):
                 responses.append(result)
             else:
                 logger.warning("Service failed", service=name, error=str(result))
+                failed.append(name)
 
         if not responses:
+            await self._handle_service_failures(failed)
             raise RuntimeError("All AI services failed to generate content")
+        self._handle_service_failures_later(failed)
 
         return responses
 
@@ -157,25 +354,153 @@ class AIOrchestrator:
         platform: str,
         brand_context: dict | None = None,
     ) -> dict[str, ContentResponse]:
-        """Generate a complete content package for a video."""
-        from social_video_automation.ai_services.base import ContentType
+        """Generate a complete content package for a video.
 
+        All four content types are requested in a single JSON-mode call so the
+        brand and platform context is only sent once.
+        """
         if brand_context is None:
-            from social_video_automation.config import get_settings
-            settings = get_settings()
-            brand_context = {
-                "name": settings.brand.name,
-                "tagline": settings.brand.tagline,
-                "tone": settings.brand.tone,
-            }
-
-        content_types = [
-            ContentType.VIDEO_SCRIPT,
-            ContentType.CAPTION,
-            ContentType.HASHTAGS,
-            ContentType.THUMBNAIL_PROMPT,
-        ]
+            brand_context = _default_brand_context()
+
+        return await self._generate_batched(topic, platform, brand_context)
+
+    async def generate_video_content_package_streaming(
+        self,
+        topic: str,
+        platform: str,
+        brand_context: dict | None = None,
+    ) -> AsyncIterator[tuple[str, ContentResponse]]:
+        """Yield each content type of a video package as soon as it is ready.
+
+        The script gets its own request so callers can act on it while the
+        caption, hashtags and thumbnail prompt are generated together in one
+        batched request. Content types that fail are logged and not yielded.
+        """
+        if brand_context is None:
+            brand_context = _default_brand_context()
+
+        async def generate_script() -> list[tuple[str, ContentResponse]]:
+            request = ContentRequest(
+                content_type=ContentType.VIDEO_SCRIPT,
+                topic=topic,
+                platform=platform,
+                brand_context=brand_context,
+            )
+            result = await _safe(self.generate_content(request))
+            if isinstance(result, ContentResponse):
+                return [(ContentType.VIDEO_SCRIPT.value, result)]
+            logger.error(
+                "Failed to generate content",
+                content_type=ContentType.VIDEO_SCRIPT.value,
+                error=str(result),
+            )
+            return []
+
+        async def generate_rest() -> list[tuple[str, ContentResponse]]:
+            rest = [ct for ct in VIDEO_PACKAGE_FIELDS if ct != ContentType.VIDEO_SCRIPT]
+            package = await self._generate_batched(topic, platform, brand_context, rest)
+            return list(package.items())
+
+        tasks = [asyncio.create_task(generate_script()), asyncio.create_task(generate_rest())]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for item in await next_done:
+                    yield item
+        finally:
+            # The caller may stop iterating early
+            for task in tasks:
+                task.cancel()
+
+    async def _generate_batched(
+        self,
+        topic: str,
+        platform: str,
+        brand_context: dict,
+        content_types: Sequence[ContentType] = VIDEO_PACKAGE_FIELDS,
+    ) -> dict[str, ContentResponse]:
+        """Generate package content types with one VIDEO_PACKAGE request.
+
+        If the batched response cannot be used, each content type is requested
+        separately; content types missing from a usable response are
+        re-requested on their own.
+        """
+        omitted = [ct.value for ct in VIDEO_PACKAGE_FIELDS if ct not in content_types]
+        request = ContentRequest(
+            content_type=ContentType.VIDEO_PACKAGE,
+            topic=topic,
+            platform=platform,
+            brand_context=brand_context,
+            additional_context=f"Leave out these fields: {', '.join(omitted)}" if omitted else "",
+        )
+
+        package: dict[str, ContentResponse] | None = None
+        try:
+            response = await self.generate_content(request)
+            if isinstance(response, ContentResponse):
+                package = self._split_video_package(response, content_types)
+        except Exception as e:
+            logger.warning(
+                "Batched content package failed, requesting content types separately",
+                error=str(e),
+            )
+
+        if package is None:
+            return await self._generate_content_types(
+                topic, platform, brand_context, content_types
+            )
+
+        missing = [ct for ct in content_types if ct.value not in package]
+        if missing:
+            logger.warning(
+                "Content missing from package, requesting separately",
+                content_types=[ct.value for ct in missing],
+            )
+            package.update(
+                await self._generate_content_types(topic, platform, brand_context, missing)
+            )
+        return package
 
+    def _split_video_package(
+        self,
+        response: ContentResponse,
+        content_types: Sequence[ContentType] = VIDEO_PACKAGE_FIELDS,
+    ) -> dict[str, ContentResponse]:
+        """Split a VIDEO_PACKAGE JSON response into per-content-type responses.
+
+        Raises ValueError if the content is not a JSON object, e.g. when the
+        output was truncated. Empty, missing or unrequested fields are left out.
+        """
+        data = json.loads(response.content)
+        if not isinstance(data, dict):
+            raise ValueError("Video package response is not a JSON object")
+
+        package: dict[str, ContentResponse] = {}
+        for content_type in content_types:
+            value = data.get(content_type.value)
+            if not value:
+                continue
+            if isinstance(value, list):
+                value = " ".join(str(item) for item in value)
+
+            package[content_type.value] = ContentResponse(
+                content=str(value),
+                content_type=content_type,
+                ai_service=response.ai_service,
+                # Token usage covers the whole package; attribute it once
+                tokens_used=0 if package else response.tokens_used,
+                metadata={**response.metadata, "batched": True},
+            )
+
+        return package
+
+    async def _generate_content_types(
+        self,
+        topic: str,
+        platform: str,
+        brand_context: dict,
+        content_types: Sequence[ContentType] = VIDEO_PACKAGE_FIELDS,
+    ) -> dict[str, ContentResponse]:
+        """Generate each package content type with its own request."""
         tasks = []
         for content_type in content_types:
             request = ContentRequest(
@@ -184,12 +509,12 @@ class AIOrchestrator:
                 platform=platform,
                 brand_context=brand_context,
             )
-            tasks.append(self.generate_content(request))
+            tasks.append(_safe(self.generate_content(request)))
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks)
 
         package = {}
-        for content_type, result in zip(content_types, results):
+        for content_type, result in zip(content_types, results, strict=True):
             if isinstance(result, ContentResponse):
                 package[content_type.value] = result
             else:
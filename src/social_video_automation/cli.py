@@ -1,25 +1,70 @@
 """CLI for Social Video Automation."""
 
 import asyncio
-from typing import Annotated
+import sys
+from collections.abc import Coroutine
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="sva",
     help="Social Video Automation - AI-powered video generation and social posting for PeterMat",
     no_args_is_help=True,
 )
-console = Console()
+
+
+@lru_cache
+def _console() -> "Console":
+    """Get the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _ellipsize(text: str, limit: int) -> str:
+    """Truncate text to at most limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit - 1]}…"
 
 
 def run_async(coro):
-    """Run async function in sync context."""
-    return asyncio.run(coro)
+    """Run async function in sync context, on uvloop when it is installed."""
+    import structlog
+
+    # Module loggers are lazy proxies; cache each one after its first call so
+    # later log calls skip re-resolving the configuration
+    if not structlog.is_configured():
+        structlog.configure(cache_logger_on_first_use=True)
+
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
+    return asyncio.run(_run_and_close(coro))
+
+
+async def _run_and_close(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Await a command coroutine, then close the shared HTTP clients it may have opened."""
+    from social_video_automation.ai_services import _http as ai_http
+    from social_video_automation.social import _http as social_http
+    from social_video_automation.video import _http as video_http
+
+    try:
+        return await coro
+    finally:
+        await asyncio.gather(
+            ai_http.close_http_client(),
+            social_http.close_http_client(),
+            video_http.close_http_client(),
+        )
 
 
 @app.command()
@@ -39,8 +84,14 @@ def generate(
     ] = False,
 ):
     """Generate and post video content to social media."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
     from social_video_automation.content import ContentPipeline
 
+    console = _console()
+
     platform_list = [p.strip() for p in platforms.split(",")]
 
     console.print(Panel(
@@ -79,7 +130,7 @@ def generate(
         # Show generated content
         if result.script:
             console.print(Panel(
-                result.script.content[:500] + "..." if len(result.script.content) > 500 else result.script.content,
+                _ellipsize(result.script.content, 500),
                 title="📝 Generated Script",
                 subtitle=f"via {result.script.ai_service}",
             ))
@@ -101,7 +152,7 @@ def generate(
                 table.add_row(
                     platform,
                     "[green]✓ Generated[/]",
-                    video.video_url[:50] + "..." if len(video.video_url) > 50 else video.video_url,
+                    _ellipsize(video.video_url, 50),
                 )
 
             console.print(table)
@@ -115,8 +166,7 @@ def generate(
 
             for platform, pr in result.post_results.items():
                 status = "[green]✓ Posted[/]" if pr.success else f"[red]✗ {pr.error}[/]"
-                url = pr.post_url or "-"
-                table.add_row(platform, status, url[:50] + "..." if len(url) > 50 else url)
+                table.add_row(platform, status, _ellipsize(pr.post_url or "-", 50))
 
             console.print(table)
 
@@ -141,8 +191,12 @@ def content(
     ] = "instagram",
 ):
     """Generate content only (script, caption, hashtags) without video."""
+    from rich.panel import Panel
+
     from social_video_automation.content import ContentPipeline
 
+    console = _console()
+
     console.print(f"[bold]Generating content for:[/] {topic}")
 
     async def run():
@@ -162,17 +216,30 @@ def content(
 @app.command()
 def status():
     """Check status of all configured services."""
-    from social_video_automation.ai_services import AIOrchestrator
-    from social_video_automation.social import SocialManager
-    from social_video_automation.video import VideoManager
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from social_video_automation.content.pipeline import get_ai, get_social, get_video
+
+    console = _console()
 
     console.print(Panel("[bold]Checking service status...[/]", title="🔍 Status Check"))
 
     async def run():
-        # Check AI services
-        ai = AIOrchestrator()
-        ai_available = await ai.get_available_services()
+        ai = get_ai()
+        video = get_video()
+        social = get_social()
+
+        # Probe every service at once (AI with a live request, not just the key);
+        # accounts load while the tables render
+        ai_available, video_available, social_available = await asyncio.gather(
+            ai.ping_services(),
+            video.get_available_generators(),
+            social.get_available_posters(),
+        )
+        accounts_task = asyncio.create_task(social.get_all_connected_accounts())
 
+        # AI services
         table = Table(title="AI Services")
         table.add_column("Service")
         table.add_column("Status")
@@ -183,10 +250,7 @@ def status():
 
         console.print(table)
 
-        # Check video services
-        video = VideoManager()
-        video_available = await video.get_available_generators()
-
+        # Video services
         table = Table(title="Video Generators")
         table.add_column("Service")
         table.add_column("Status")
@@ -197,10 +261,7 @@ def status():
 
         console.print(table)
 
-        # Check social services
-        social = SocialManager()
-        social_available = await social.get_available_posters()
-
+        # Social services
         table = Table(title="Social Media Posters")
         table.add_column("Service")
         table.add_column("Status")
@@ -211,9 +272,9 @@ def status():
 
         console.print(table)
 
-        # Check connected accounts
+        # Connected accounts
+        accounts = await accounts_task
         if social_available:
-            accounts = await social.get_all_connected_accounts()
             for poster, accts in accounts.items():
                 if accts:
                     console.print(f"\n[bold]{poster.title()} Connected Accounts:[/]")
@@ -233,17 +294,20 @@ def ideas(
     ] = 5,
 ):
     """Generate content ideas for PeterMat."""
-    from social_video_automation.ai_services import AIOrchestrator
+    from rich.panel import Panel
+
     from social_video_automation.ai_services.base import ContentRequest, ContentType
     from social_video_automation.config import get_settings
+    from social_video_automation.content.pipeline import get_ai
 
     settings = get_settings()
     theme = theme or settings.brand.content_themes[0]
 
+    console = _console()
     console.print(f"[bold]Generating {count} content ideas for theme:[/] {theme}")
 
     async def run():
-        ai = AIOrchestrator()
+        ai = get_ai()
 
         request = ContentRequest(
             content_type=ContentType.CONTENT_IDEA,
@@ -271,7 +335,9 @@ def ideas(
 @app.command()
 def init():
     """Initialize configuration and show setup instructions."""
-    console.print(Panel("""
+    from rich.panel import Panel
+
+    _console().print(Panel("""
 [bold]Social Video Automation Setup[/]
 
 1. Copy .env.example to .env:
@@ -13,6 +13,13 @@ class AISettings(BaseSettings):
     openai_api_key: str = Field(default="", description="OpenAI API key for ChatGPT")
     google_ai_api_key: str = Field(default="", description="Google AI API key for Gemini")
     xai_api_key: str = Field(default="", description="xAI API key for Grok")
+    max_concurrent_requests: int = Field(
+        default=4, description="Maximum AI service requests in flight at once"
+    )
+    priority_hedge_delay: float = Field(
+        default=5.0,
+        description="Seconds to wait on a service before also trying the next in priority order",
+    )
 
 
 class VideoSettings(BaseSettings):
@@ -23,6 +30,9 @@ class VideoSettings(BaseSettings):
     default_resolution: str = Field(default="1080x1920", description="Default video resolution")
     default_fps: int = Field(default=30, description="Default frames per second")
     default_duration: int = Field(default=30, description="Default video duration in seconds")
+    max_concurrent_renders: int = Field(
+        default=3, description="Maximum video renders in flight at once"
+    )
 
 
 class SocialSettings(BaseSettings):
@@ -34,6 +44,18 @@ class SocialSettings(BaseSettings):
         default=["instagram", "tiktok", "youtube", "facebook"],
         description="Target social platforms",
     )
+    max_concurrent_posts: int = Field(
+        default=6, description="Maximum post requests to the posting service in flight at once"
+    )
+    post_max_retries: int = Field(
+        default=3, description="Retries for a post rejected with a 429 or 503"
+    )
+    post_retry_base_delay: float = Field(
+        default=1.0, description="Initial retry delay in seconds, doubled each attempt"
+    )
+    post_retry_max_delay: float = Field(
+        default=30.0, description="Maximum retry delay in seconds"
+    )
 
 
 class BrandSettings(BaseSettings):
@@ -1,7 +1,11 @@
 """Content Pipeline - End-to-end content generation and posting."""
 
+import asyncio
+import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 
 import structlog
 
@@ -15,8 +19,51 @@ from social_video_automation.video.base import VideoResult
 
 logger = structlog.get_logger()
 
+# PipelineResult attribute that holds each generated content type
+_RESULT_FIELDS = {
+    ContentType.VIDEO_SCRIPT: "script",
+    ContentType.CAPTION: "caption",
+    ContentType.HASHTAGS: "hashtags",
+    ContentType.THUMBNAIL_PROMPT: "thumbnail_prompt",
+}
 
-@dataclass
+_HASHTAG_RE = re.compile(r"#(\w+)")
+# A whole whitespace- or comma-separated token, '#' optional
+_BARE_TAG_RE = re.compile(r"(?<![^\s,])#?(\w{2,30})(?![^\s,])")
+
+
+def parse_hashtags(content: str, limit: int = 15, *, bare_words: bool = False) -> list[str]:
+    """Extract hashtags (without the leading '#') from generated content.
+
+    With ``bare_words``, content without any #tags falls back to its plain
+    word tokens, for models that return tags without the '#'. Tokens with
+    other punctuation, like ``gym-life`` or ``don't``, are skipped.
+    """
+    tags = _HASHTAG_RE.findall(content)
+    if not tags and bare_words:
+        tags = _BARE_TAG_RE.findall(content)
+    return tags[:limit]
+
+
+@lru_cache
+def get_ai() -> AIOrchestrator:
+    """Get the shared AI orchestrator."""
+    return AIOrchestrator()
+
+
+@lru_cache
+def get_video() -> VideoManager:
+    """Get the shared video manager."""
+    return VideoManager()
+
+
+@lru_cache
+def get_social() -> SocialManager:
+    """Get the shared social manager."""
+    return SocialManager()
+
+
+@dataclass(slots=True)
 class PipelineResult:
     """Result from the full content pipeline."""
 
@@ -42,6 +89,10 @@ class PipelineResult:
     # Errors
     errors: list[str] = field(default_factory=list)
 
+    # Monotonic ns for the duration; last so positional construction is unchanged
+    started_monotonic: int | None = None
+    completed_monotonic: int | None = None
+
     @property
     def success(self) -> bool:
         """Check if pipeline completed successfully."""
@@ -55,6 +106,8 @@ class PipelineResult:
     @property
     def duration_seconds(self) -> float | None:
         """Get pipeline duration in seconds."""
+        if self.started_monotonic is not None and self.completed_monotonic is not None:
+            return (self.completed_monotonic - self.started_monotonic) / 1e9
         if self.started_at and self.completed_at:
             return (self.completed_at - self.started_at).total_seconds()
         return None
@@ -65,9 +118,16 @@ class ContentPipeline:
 
     def __init__(self) -> None:
         self.settings = get_settings()
-        self.ai = AIOrchestrator()
-        self.video = VideoManager()
-        self.social = SocialManager()
+        self.ai = get_ai()
+        self.video = get_video()
+        self.social = get_social()
+
+        # Brand context is fixed for the process; tone is a tuple so it can be hashed
+        self._brand_context = {
+            "name": self.settings.brand.name,
+            "tagline": self.settings.brand.tagline,
+            "tone": tuple(self.settings.brand.tone),
+        }
 
     async def run(
         self,
@@ -85,6 +145,7 @@ class ContentPipeline:
             topic=topic,
             platforms=platforms,
             started_at=datetime.now(),
+            started_monotonic=time.monotonic_ns(),
         )
 
         logger.info(
@@ -95,12 +156,40 @@ class ContentPipeline:
         )
 
         try:
-            # Step 1: Generate content using AI services
-            await self._generate_content(result)
-
-            # Step 2: Generate videos (if enabled)
-            if generate_video and result.script:
-                await self._generate_videos(result)
+            # Step 1: Generate content using AI services, taking each field as it lands
+            logger.info("Generating content", topic=topic)
+            primary_platform = platforms[0] if platforms else "instagram"
+            video_task = None
+            try:
+                async for _, response in self.ai.generate_video_content_package_streaming(
+                    topic=topic,
+                    platform=primary_platform,
+                    brand_context=self._brand_context,
+                ):
+                    setattr(result, _RESULT_FIELDS[response.content_type], response)
+                    if response.content_type != ContentType.VIDEO_SCRIPT:
+                        continue
+
+                    logger.info(
+                        "Content generated",
+                        script_length=len(response.content),
+                        ai_service=response.ai_service,
+                    )
+                    # Step 2: Generate videos (if enabled) as soon as the script lands,
+                    # while the caption, hashtags and thumbnail prompt finish
+                    if generate_video:
+                        video_task = asyncio.create_task(self._generate_videos(result))
+            except BaseException:
+                # Don't leave a billed render running unobserved
+                if video_task is not None:
+                    video_task.cancel()
+                    await asyncio.gather(video_task, return_exceptions=True)
+                raise
+
+            if not result.script:
+                result.errors.append("Failed to generate video script")
+            if video_task is not None:
+                await video_task
 
             # Step 3: Post to social media (if enabled)
             if post_content and result.videos:
@@ -111,6 +200,7 @@ class ContentPipeline:
             result.errors.append(str(e))
 
         result.completed_at = datetime.now()
+        result.completed_monotonic = time.monotonic_ns()
 
         logger.info(
             "Pipeline completed",
@@ -121,40 +211,6 @@ class ContentPipeline:
 
         return result
 
-    async def _generate_content(self, result: PipelineResult) -> None:
-        """Generate content using AI services."""
-        logger.info("Generating content", topic=result.topic)
-
-        brand_context = {
-            "name": self.settings.brand.name,
-            "tagline": self.settings.brand.tagline,
-            "tone": self.settings.brand.tone,
-        }
-
-        # Generate content package for the primary platform
-        primary_platform = result.platforms[0] if result.platforms else "instagram"
-
-        content_package = await self.ai.generate_video_content_package(
-            topic=result.topic,
-            platform=primary_platform,
-            brand_context=brand_context,
-        )
-
-        # Store results
-        result.script = content_package.get(ContentType.VIDEO_SCRIPT.value)
-        result.caption = content_package.get(ContentType.CAPTION.value)
-        result.hashtags = content_package.get(ContentType.HASHTAGS.value)
-        result.thumbnail_prompt = content_package.get(ContentType.THUMBNAIL_PROMPT.value)
-
-        if result.script:
-            logger.info(
-                "Content generated",
-                script_length=len(result.script.content),
-                ai_service=result.script.ai_service,
-            )
-        else:
-            result.errors.append("Failed to generate video script")
-
     async def _generate_videos(self, result: PipelineResult) -> None:
         """Generate videos for all platforms."""
         if not result.script:
@@ -163,7 +219,7 @@ class ContentPipeline:
 
         logger.info("Generating videos", platforms=result.platforms)
 
-        # Generate for all platforms
+        # Generate for all platforms; VideoManager bounds concurrent renders
         videos = await self.video.generate_for_all_platforms(
             script=result.script.content,
             title=result.topic,
@@ -193,35 +249,56 @@ class ContentPipeline:
             return
 
         # Parse hashtags
-        hashtags = []
-        if result.hashtags:
-            # Extract hashtags from the generated content
-            hashtag_content = result.hashtags.content
-            hashtags = [
-                tag.strip().lstrip("#")
-                for tag in hashtag_content.split()
-                if tag.startswith("#") or not any(c in tag for c in " \n")
-            ][:15]  # Limit to 15 hashtags
+        hashtags = parse_hashtags(result.hashtags.content) if result.hashtags else []
 
         logger.info("Posting content", schedule=schedule, hashtag_count=len(hashtags))
 
-        # Post each video to its platform
+        # Platforms sharing the same rendered video are posted in one request;
+        # each distinct video is posted concurrently
+        groups: dict[str, list[str]] = {}
         for platform, video in result.videos.items():
-            try:
-                post_results = await self.social.post(
+            groups.setdefault(video.video_url, []).append(platform)
+
+        posted = await asyncio.gather(
+            *[
+                self._post_group(
+                    platforms=group_platforms,
+                    video_url=video_url,
                     caption=result.caption.content,
                     hashtags=hashtags,
-                    video_url=video.video_url,
-                    platforms=[platform],
-                    youtube_title=result.topic if platform == "youtube" else "",
+                    youtube_title=result.topic if "youtube" in group_platforms else "",
                 )
+                for video_url, group_platforms in groups.items()
+            ],
+            return_exceptions=True,
+        )
+
+        for group_platforms, outcome in zip(groups.values(), posted, strict=True):
+            if isinstance(outcome, BaseException):
+                for platform in group_platforms:
+                    logger.error("Posting failed", platform=platform, error=str(outcome))
+                    result.errors.append(f"Failed to post to {platform}: {outcome}")
+                continue
 
-                for pr in post_results:
-                    result.post_results[pr.platform.value] = pr
+            for pr in outcome:
+                result.post_results[pr.platform.value] = pr
 
-            except Exception as e:
-                logger.error("Posting failed", platform=platform, error=str(e))
-                result.errors.append(f"Failed to post to {platform}: {e}")
+    async def _post_group(
+        self,
+        platforms: list[str],
+        video_url: str,
+        caption: str,
+        hashtags: list[str],
+        youtube_title: str = "",
+    ) -> list[PostResult]:
+        """Post one video to a group of platforms."""
+        return await self.social.post(
+            caption=caption,
+            hashtags=hashtags,
+            video_url=video_url,
+            platforms=platforms,
+            youtube_title=youtube_title,
+        )
 
     async def generate_content_only(
         self,
@@ -229,16 +306,10 @@ class ContentPipeline:
         platform: str = "instagram",
     ) -> dict[str, ContentResponse]:
         """Generate content without video/posting."""
-        brand_context = {
-            "name": self.settings.brand.name,
-            "tagline": self.settings.brand.tagline,
-            "tone": self.settings.brand.tone,
-        }
-
         return await self.ai.generate_video_content_package(
             topic=topic,
             platform=platform,
-            brand_context=brand_context,
+            brand_context=self._brand_context,
         )
 
     async def generate_video_only(
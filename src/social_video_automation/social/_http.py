@@ -0,0 +1,50 @@
+"""Shared HTTP connection pool for social media posters."""
+
+import httpx
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+class SocialAPIError(httpx.HTTPError):
+    """Error status returned by a social media API."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def check_response(response: httpx.Response) -> None:
+    """Raise SocialAPIError unless the response status is 2xx."""
+    if not 200 <= response.status_code < 300:
+        raise SocialAPIError(response.status_code, f"HTTP {response.status_code}")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP/2 client shared by Ayrshare and Late.
+
+    Posters pass full URLs and their own auth headers on each request.
+    Failed connection attempts are retried.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60,
+                ),
+            ),
+        )
+    return _shared_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
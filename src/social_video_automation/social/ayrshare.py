@@ -1,9 +1,17 @@
 """Ayrshare social media posting service."""
 
+import asyncio
+import dataclasses
+import time
+from datetime import datetime
+from typing import Any
+
 import httpx
+import orjson
 import structlog
 
 from social_video_automation.config import get_settings
+from social_video_automation.social._http import check_response, get_http_client
 from social_video_automation.social.base import (
     PostRequest,
     PostResult,
@@ -16,6 +24,39 @@ logger = structlog.get_logger()
 AYRSHARE_API_URL = "https://api.ayrshare.com"
 
 
+def _youtube_options(request: PostRequest) -> dict:
+    """Build Ayrshare YouTube options."""
+    return {
+        "title": request.youtube_options.get("title", ""),
+        "visibility": request.youtube_options.get("visibility", "public"),
+        "shorts": True,  # Default to Shorts for short videos
+    }
+
+
+def _tiktok_options(request: PostRequest) -> dict:
+    """Build Ayrshare TikTok options."""
+    return {
+        "allowComment": request.tiktok_options.get("allow_comments", True),
+        "allowDuet": request.tiktok_options.get("allow_duet", True),
+        "allowStitch": request.tiktok_options.get("allow_stitch", True),
+    }
+
+
+def _instagram_options(_request: PostRequest) -> dict:
+    """Build Ayrshare Instagram options."""
+    return {
+        "reels": True,  # Post as Reels for video content
+    }
+
+
+# Payload key and builder for each platform with specific options
+_PLATFORM_OPTIONS = {
+    SocialPlatform.YOUTUBE: ("youTubeOptions", _youtube_options),
+    SocialPlatform.TIKTOK: ("tikTokOptions", _tiktok_options),
+    SocialPlatform.INSTAGRAM: ("instagramOptions", _instagram_options),
+}
+
+
 class AyrsharePoster(SocialPoster):
     """Social media poster using Ayrshare API."""
 
@@ -32,40 +73,85 @@ class AyrsharePoster(SocialPoster):
         SocialPlatform.PINTEREST: "pinterest",
     }
 
+    # Seconds to reuse the /api/user response
+    USER_CACHE_TTL = 60.0
+
+    # Seconds to wait for the availability probe
+    AVAILABILITY_TIMEOUT = 5.0
+
+    # Seconds to reuse an availability check, including a failed one
+    AVAILABILITY_TTL = 30.0
+
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._client: httpx.AsyncClient | None = None
+        self._headers = {
+            "Authorization": f"Bearer {self.settings.social.ayrshare_api_key}",
+            "Content-Type": "application/json",
+        }
+        self._user_cache: tuple[float, dict] | None = None
+        self._user_lock = asyncio.Lock()
+        self._avail_cache: tuple[float, bool] | None = None
+        self._avail_lock = asyncio.Lock()
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Lazy-loaded HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=AYRSHARE_API_URL,
-                headers={
-                    "Authorization": f"Bearer {self.settings.social.ayrshare_api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=120.0,
+        """HTTP client shared by all social posters."""
+        return get_http_client()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send an authenticated request to the Ayrshare API."""
+        return await self.client.request(
+            method, f"{AYRSHARE_API_URL}{path}", headers=self._headers, **kwargs
+        )
+
+    def clear_cache(self) -> None:
+        """Drop the cached account details and availability so the next call refetches them."""
+        self._user_cache = None
+        self._avail_cache = None
+
+    async def _fetch_user(self, timeout: float | None = None) -> dict:
+        """Fetch account details from /api/user, cached for USER_CACHE_TTL seconds."""
+        async with self._user_lock:
+            if self._user_cache is not None:
+                fetched_at, data = self._user_cache
+                if time.monotonic() - fetched_at < self.USER_CACHE_TTL:
+                    return data
+
+            response = await self._request(
+                "GET",
+                "/api/user",
+                timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
             )
-        return self._client
+            check_response(response)
+            data = orjson.loads(response.content)
+            self._user_cache = (time.monotonic(), data)
+            return data
 
     async def is_available(self) -> bool:
-        """Check if Ayrshare is available."""
+        """Check if Ayrshare is available, cached for AVAILABILITY_TTL seconds."""
         if not self.settings.social.ayrshare_api_key:
             return False
-        try:
-            response = await self.client.get("/api/user")
-            return response.status_code == 200
-        except Exception as e:
-            logger.warning("Ayrshare unavailable", error=str(e))
-            return False
+
+        # Concurrent callers share one probe
+        async with self._avail_lock:
+            if self._avail_cache is not None:
+                checked_at, available = self._avail_cache
+                if time.monotonic() - checked_at < self.AVAILABILITY_TTL:
+                    return available
+
+            try:
+                await self._fetch_user(timeout=self.AVAILABILITY_TIMEOUT)
+                available = True
+            except Exception as e:
+                logger.warning("Ayrshare unavailable", error=str(e))
+                available = False
+
+            self._avail_cache = (time.monotonic(), available)
+            return available
 
     async def get_connected_accounts(self) -> list[dict]:
         """Get list of connected social media accounts."""
-        response = await self.client.get("/api/user")
-        response.raise_for_status()
-        data = response.json()
+        data = await self._fetch_user()
 
         # Extract connected platforms
         accounts = []
@@ -78,6 +164,9 @@ class AyrsharePoster(SocialPoster):
 
     async def post(self, request: PostRequest) -> list[PostResult]:
         """Post content to multiple platforms."""
+        if request.scheduled_times:
+            return await self._post_per_schedule(request)
+
         # Build the post payload
         payload = self._build_payload(request)
 
@@ -87,14 +176,19 @@ class AyrsharePoster(SocialPoster):
             has_video=bool(request.video_url),
         )
 
-        response = await self.client.post("/api/post", json=payload)
+        response = await self._request("POST", "/api/post", content=orjson.dumps(payload))
+
+        # Error bodies (e.g. from a proxy) are not always JSON
+        try:
+            data = orjson.loads(response.content)
+        except ValueError:
+            data = {}
 
         results = []
         if response.status_code == 200:
-            data = response.json()
             results = self._parse_response(data, request.platforms)
         else:
-            error = response.json().get("message", "Unknown error")
+            error = data.get("message") or response.text[:200] or "Unknown error"
             for platform in request.platforms:
                 results.append(PostResult(
                     platform=platform,
@@ -104,6 +198,23 @@ class AyrsharePoster(SocialPoster):
 
         return results
 
+    async def _post_per_schedule(self, request: PostRequest) -> list[PostResult]:
+        """Post once per distinct scheduled time; Ayrshare takes one scheduleDate per post."""
+        groups: dict[datetime | None, list[SocialPlatform]] = {}
+        for platform in request.platforms:
+            groups.setdefault(request.scheduled_time_for(platform), []).append(platform)
+
+        posted = await asyncio.gather(*[
+            self.post(dataclasses.replace(
+                request,
+                platforms=platforms,
+                scheduled_time=scheduled_time,
+                scheduled_times={},
+            ))
+            for scheduled_time, platforms in groups.items()
+        ])
+        return [result for results in posted for result in results]
+
     def _build_payload(self, request: PostRequest) -> dict:
         """Build Ayrshare post payload."""
         platforms = [self.PLATFORM_MAP[p] for p in request.platforms]
@@ -124,27 +235,13 @@ class AyrsharePoster(SocialPoster):
 
         # Add scheduling
         if request.scheduled_time:
-            payload["scheduleDate"] = request.scheduled_time.isoformat()
+            payload["scheduleDate"] = request.scheduled_time  # orjson emits ISO 8601
 
         # Platform-specific options
-        if SocialPlatform.YOUTUBE in request.platforms:
-            payload["youTubeOptions"] = {
-                "title": request.youtube_options.get("title", ""),
-                "visibility": request.youtube_options.get("visibility", "public"),
-                "shorts": True,  # Default to Shorts for short videos
-            }
-
-        if SocialPlatform.TIKTOK in request.platforms:
-            payload["tikTokOptions"] = {
-                "allowComment": request.tiktok_options.get("allow_comments", True),
-                "allowDuet": request.tiktok_options.get("allow_duet", True),
-                "allowStitch": request.tiktok_options.get("allow_stitch", True),
-            }
-
-        if SocialPlatform.INSTAGRAM in request.platforms:
-            payload["instagramOptions"] = {
-                "reels": True,  # Post as Reels for video content
-            }
+        platform_set = set(request.platforms)
+        for platform, (key, build_options) in _PLATFORM_OPTIONS.items():
+            if platform in platform_set:
+                payload[key] = build_options(request)
 
         return payload
 
@@ -156,9 +253,9 @@ class AyrsharePoster(SocialPoster):
 
         # Check for overall success
         if data.get("status") == "success":
+            post_ids = data.get("postIds", {})
             for platform in platforms:
-                platform_key = self.PLATFORM_MAP[platform]
-                platform_data = data.get("postIds", {}).get(platform_key, {})
+                platform_data = post_ids.get(self.PLATFORM_MAP[platform], {})
 
                 results.append(PostResult(
                     platform=platform,
@@ -170,13 +267,9 @@ class AyrsharePoster(SocialPoster):
                 ))
         else:
             # Handle errors
-            errors = data.get("errors", [])
+            error_by_key = {e.get("platform"): e for e in data.get("errors", [])}
             for platform in platforms:
-                platform_key = self.PLATFORM_MAP[platform]
-                platform_error = next(
-                    (e for e in errors if e.get("platform") == platform_key),
-                    None
-                )
+                platform_error = error_by_key.get(self.PLATFORM_MAP[platform])
 
                 results.append(PostResult(
                     platform=platform,
@@ -189,20 +282,22 @@ class AyrsharePoster(SocialPoster):
 
     async def get_post_analytics(self, post_id: str, platform: SocialPlatform) -> dict:
         """Get analytics for a specific post."""
-        response = await self.client.get(
+        response = await self._request(
+            "GET",
             "/api/analytics/post",
             params={
                 "id": post_id,
                 "platforms": [self.PLATFORM_MAP[platform]],
             }
         )
-        response.raise_for_status()
-        return response.json()
+        check_response(response)
+        return orjson.loads(response.content)
 
     async def delete_post(self, post_id: str) -> bool:
         """Delete a scheduled or published post."""
-        response = await self.client.delete(
+        response = await self._request(
+            "DELETE",
             "/api/post",
-            json={"id": post_id}
+            content=orjson.dumps({"id": post_id}),
         )
         return response.status_code == 200
@@ -20,7 +20,17 @@ class SocialPlatform(str, Enum):
     PINTEREST = "pinterest"
 
 
-@dataclass
+_STR_TO_PLATFORM = {platform.value: platform for platform in SocialPlatform}
+
+
+def to_platform(value: str) -> SocialPlatform:
+    """Convert a platform name to SocialPlatform via a plain dict lookup."""
+    platform = _STR_TO_PLATFORM.get(value)
+    # Fall back to the Enum constructor for its ValueError on unknown names
+    return platform if platform is not None else SocialPlatform(value)
+
+
+@dataclass(slots=True)
 class PostRequest:
     """Request for social media post."""
 
@@ -44,16 +54,30 @@ class PostRequest:
     youtube_options: dict = field(default_factory=dict)
     facebook_options: dict = field(default_factory=dict)
 
+    # Per-platform overrides of scheduled_time; last so positional fields keep their order
+    scheduled_times: dict[SocialPlatform, datetime] = field(default_factory=dict)
+
+    # Derived from caption/hashtags once, in __post_init__
+    hashtag_str: str = field(init=False, repr=False, compare=False)
+    _full_caption: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.hashtag_str = " ".join(f"#{tag.lstrip('#')}" for tag in self.hashtags)
+        self._full_caption = (
+            f"{self.caption}\n\n{self.hashtag_str}" if self.hashtag_str else self.caption
+        )
+
+    def scheduled_time_for(self, platform: SocialPlatform) -> datetime | None:
+        """Get the scheduled time for a platform."""
+        return self.scheduled_times.get(platform, self.scheduled_time)
+
     @property
     def full_caption(self) -> str:
         """Get caption with hashtags appended."""
-        if not self.hashtags:
-            return self.caption
-        hashtag_str = " ".join(f"#{tag.lstrip('#')}" for tag in self.hashtags)
-        return f"{self.caption}\n\n{hashtag_str}"
+        return self._full_caption
 
 
-@dataclass
+@dataclass(slots=True)
 class PostResult:
     """Result from posting to social media."""
 
@@ -1,9 +1,17 @@
 """Late.dev social media posting service."""
 
+import asyncio
+import random
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
 import httpx
+import orjson
 import structlog
 
 from social_video_automation.config import get_settings
+from social_video_automation.social._http import check_response, get_http_client
 from social_video_automation.social.base import (
     PostRequest,
     PostResult,
@@ -15,93 +23,193 @@ logger = structlog.get_logger()
 
 LATE_API_URL = "https://api.getlate.dev"
 
+# Responses worth retrying: the request was rejected before a post was created.
+# 500/502/504 are not retried; Late may already have created the post.
+RETRY_STATUS_CODES = frozenset({429, 503})
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Get the Retry-After delay in seconds, if given as a number."""
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _build_media(request: PostRequest) -> list[dict]:
+    """Build the Late media list for a request."""
+    if request.video_url:
+        return [{"type": "video", "url": request.video_url}]
+    return [{"type": "image", "url": url} for url in request.image_urls]
+
+
+def _add_youtube(request: PostRequest, payload: dict) -> None:
+    """Add Late YouTube options."""
+    payload["youtube"] = {
+        "title": request.youtube_options.get("title", ""),
+        "privacyStatus": request.youtube_options.get("visibility", "public"),
+        "isShort": True,
+    }
+
+
+def _add_tiktok(request: PostRequest, payload: dict) -> None:
+    """Add Late TikTok options."""
+    payload["tiktok"] = {
+        "privacyLevel": "PUBLIC_TO_EVERYONE",
+        "allowComments": request.tiktok_options.get("allow_comments", True),
+        "allowDuet": request.tiktok_options.get("allow_duet", True),
+        "allowStitch": request.tiktok_options.get("allow_stitch", True),
+    }
+
+
+def _add_instagram(request: PostRequest, payload: dict) -> None:
+    """Add Late Instagram options."""
+    payload["instagram"] = {
+        "contentType": "REELS" if request.video_url else "FEED",
+    }
+
+
+class PlatformInfo(NamedTuple):
+    """Late platform key and the function adding its options to a payload."""
+
+    key: str
+    add_options: Callable[[PostRequest, dict], None] | None = None
+
+
+_PLATFORM_INFO: dict[SocialPlatform, PlatformInfo] = {
+    SocialPlatform.INSTAGRAM: PlatformInfo("instagram", _add_instagram),
+    SocialPlatform.TIKTOK: PlatformInfo("tiktok", _add_tiktok),
+    SocialPlatform.YOUTUBE: PlatformInfo("youtube", _add_youtube),
+    SocialPlatform.FACEBOOK: PlatformInfo("facebook"),
+    SocialPlatform.TWITTER: PlatformInfo("x"),  # Late uses "x" for Twitter
+    SocialPlatform.LINKEDIN: PlatformInfo("linkedin"),
+    SocialPlatform.THREADS: PlatformInfo("threads"),
+    SocialPlatform.PINTEREST: PlatformInfo("pinterest"),
+}
+
 
 class LatePoster(SocialPoster):
     """Social media poster using Late.dev API."""
 
     poster_name = "late"
 
-    PLATFORM_MAP = {
-        SocialPlatform.INSTAGRAM: "instagram",
-        SocialPlatform.TIKTOK: "tiktok",
-        SocialPlatform.YOUTUBE: "youtube",
-        SocialPlatform.FACEBOOK: "facebook",
-        SocialPlatform.TWITTER: "x",  # Late uses "x" for Twitter
-        SocialPlatform.LINKEDIN: "linkedin",
-        SocialPlatform.THREADS: "threads",
-        SocialPlatform.PINTEREST: "pinterest",
-    }
+    PLATFORM_MAP = {platform: info.key for platform, info in _PLATFORM_INFO.items()}
+
+    # Seconds to reuse an availability check
+    AVAILABILITY_TTL = 30.0
+
+    # Maximum analytics requests in flight at once
+    MAX_CONCURRENT_ANALYTICS = 64
 
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._client: httpx.AsyncClient | None = None
+        self._headers = {
+            "Authorization": f"Bearer {self.settings.social.late_api_key}",
+            "Content-Type": "application/json",
+        }
+        self._avail_cache: tuple[float, bool] | None = None
+        self._avail_lock = asyncio.Lock()
+        self._analytics_sem = asyncio.Semaphore(self.MAX_CONCURRENT_ANALYTICS)
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Lazy-loaded HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=LATE_API_URL,
-                headers={
-                    "Authorization": f"Bearer {self.settings.social.late_api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=120.0,
-            )
-        return self._client
+        """HTTP client shared by all social posters."""
+        return get_http_client()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send an authenticated request to the Late API."""
+        return await self.client.request(
+            method, f"{LATE_API_URL}{path}", headers=self._headers, **kwargs
+        )
+
+    async def _post_json(self, path: str, payload: dict) -> httpx.Response:
+        """POST an orjson-encoded payload."""
+        return await self._request("POST", path, content=orjson.dumps(payload))
+
+    async def _get_json(self, path: str, params: dict | None = None) -> dict:
+        """GET a path and decode its JSON body, raising on HTTP errors."""
+        response = await self._request("GET", path, params=params)
+        check_response(response)
+        return orjson.loads(response.content)
 
     async def is_available(self) -> bool:
-        """Check if Late is available."""
+        """Check if Late is available, cached for AVAILABILITY_TTL seconds."""
         if not self.settings.social.late_api_key:
             return False
-        try:
-            response = await self.client.get("/v1/accounts")
-            return response.status_code == 200
-        except Exception as e:
-            logger.warning("Late unavailable", error=str(e))
-            return False
+
+        # Concurrent callers share one probe
+        async with self._avail_lock:
+            if self._avail_cache is not None:
+                checked_at, available = self._avail_cache
+                if time.monotonic() - checked_at < self.AVAILABILITY_TTL:
+                    return available
+
+            try:
+                response = await self._request("GET", "/v1/accounts")
+                available = response.status_code == 200
+            except Exception as e:
+                logger.warning("Late unavailable", error=str(e))
+                available = False
+
+            self._avail_cache = (time.monotonic(), available)
+            return available
 
     async def get_connected_accounts(self) -> list[dict]:
         """Get list of connected social media accounts."""
-        response = await self.client.get("/v1/accounts")
-        response.raise_for_status()
-        return response.json().get("data", [])
+        data = await self._get_json("/v1/accounts")
+        return data.get("data", [])
 
     async def post(self, request: PostRequest) -> list[PostResult]:
         """Post content using Late API."""
-        results = []
+        # Media is identical for every platform, so build it once
+        media = _build_media(request)
+
+        # Late requires posting to each platform separately; send them concurrently
+        outcomes = await asyncio.gather(
+            *[
+                self._post_to_platform(request, platform, media)
+                for platform in request.platforms
+            ],
+            return_exceptions=True,
+        )
 
-        # Late requires posting to each platform separately
-        for platform in request.platforms:
-            result = await self._post_to_platform(request, platform)
-            results.append(result)
+        results = []
+        for platform, outcome in zip(request.platforms, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error("Failed to post", platform=platform.value, error=str(outcome))
+                outcome = PostResult(platform=platform, success=False, error=str(outcome))
+            results.append(outcome)
 
         return results
 
     async def _post_to_platform(
-        self, request: PostRequest, platform: SocialPlatform
+        self,
+        request: PostRequest,
+        platform: SocialPlatform,
+        media: list[dict] | None = None,
     ) -> PostResult:
         """Post to a single platform."""
-        payload = self._build_payload(request, platform)
+        payload = self._build_payload(request, platform, media)
+        scheduled_time = request.scheduled_time_for(platform)
 
         logger.info("Posting to Late", platform=platform.value)
 
         try:
-            response = await self.client.post("/v1/posts", json=payload)
+            response = await self._post_with_retry(payload, platform)
 
             if response.status_code in (200, 201):
-                data = response.json()
+                data = orjson.loads(response.content)
                 return PostResult(
                     platform=platform,
                     success=True,
                     post_id=data.get("data", {}).get("id"),
                     post_url=data.get("data", {}).get("url"),
-                    scheduled=request.scheduled_time is not None,
-                    scheduled_time=request.scheduled_time,
+                    scheduled=scheduled_time is not None,
+                    scheduled_time=scheduled_time,
                     metadata={"late_response": data},
                 )
             else:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 return PostResult(
                     platform=platform,
                     success=False,
@@ -116,66 +224,96 @@ class LatePoster(SocialPoster):
                 error=str(e),
             )
 
-    def _build_payload(self, request: PostRequest, platform: SocialPlatform) -> dict:
-        """Build Late post payload."""
-        platform_key = self.PLATFORM_MAP[platform]
+    async def _post_with_retry(self, payload: dict, platform: SocialPlatform) -> httpx.Response:
+        """POST a payload, retrying 429 and 503 responses with exponential backoff.
+
+        Only responses where the post cannot have been created are retried.
+        Read timeouts and other 5xx responses are not, since the post may
+        already be live. Connection failures are already retried by the
+        shared client's transport.
+        """
+        social = self.settings.social
+        for attempt in range(social.post_max_retries):
+            response = await self._post_json("/v1/posts", payload)
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+
+            delay = _retry_after(response)
+            if delay is None:
+                delay = social.post_retry_base_delay * 2**attempt + random.uniform(
+                    0, social.post_retry_base_delay
+                )
+            delay = min(delay, social.post_retry_max_delay)
+
+            logger.warning(
+                "Retrying Late post",
+                platform=platform.value,
+                attempt=attempt + 1,
+                delay=round(delay, 2),
+            )
+            await asyncio.sleep(delay)
 
+        return await self._post_json("/v1/posts", payload)
+
+    def _build_payload(
+        self,
+        request: PostRequest,
+        platform: SocialPlatform,
+        media: list[dict] | None = None,
+    ) -> dict:
+        """Build Late post payload."""
+        info = _PLATFORM_INFO[platform]
         payload: dict = {
-            "platform": platform_key,
+            "platform": info.key,
             "text": request.full_caption,
         }
 
         # Add media
-        if request.video_url:
-            payload["media"] = [{
-                "type": "video",
-                "url": request.video_url,
-            }]
-        elif request.image_urls:
-            payload["media"] = [
-                {"type": "image", "url": url} for url in request.image_urls
-            ]
+        if media is None:
+            media = _build_media(request)
+        if media:
+            payload["media"] = media
 
         # Add scheduling
-        if request.scheduled_time:
-            payload["scheduledFor"] = request.scheduled_time.isoformat()
+        scheduled_time = request.scheduled_time_for(platform)
+        if scheduled_time:
+            payload["scheduledFor"] = scheduled_time  # orjson emits ISO 8601
 
         # Platform-specific options
-        if platform == SocialPlatform.YOUTUBE:
-            payload["youtube"] = {
-                "title": request.youtube_options.get("title", ""),
-                "privacyStatus": request.youtube_options.get("visibility", "public"),
-                "isShort": True,
-            }
-
-        if platform == SocialPlatform.TIKTOK:
-            payload["tiktok"] = {
-                "privacyLevel": "PUBLIC_TO_EVERYONE",
-                "allowComments": request.tiktok_options.get("allow_comments", True),
-                "allowDuet": request.tiktok_options.get("allow_duet", True),
-                "allowStitch": request.tiktok_options.get("allow_stitch", True),
-            }
-
-        if platform == SocialPlatform.INSTAGRAM:
-            payload["instagram"] = {
-                "contentType": "REELS" if request.video_url else "FEED",
-            }
+        if info.add_options:
+            info.add_options(request, payload)
 
         return payload
 
     async def get_post_analytics(self, post_id: str, platform: SocialPlatform) -> dict:
         """Get analytics for a specific post."""
-        response = await self.client.get(f"/v1/posts/{post_id}/analytics")
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(f"/v1/posts/{post_id}/analytics")
+
+    async def get_posts_analytics(self, post_ids: list[str]) -> list[dict | Exception]:
+        """Get analytics for many posts concurrently, in the order given.
+
+        A post whose lookup fails has its exception in place of the analytics.
+        """
+        async def fetch(post_id: str) -> dict:
+            async with self._analytics_sem:
+                return await self._get_json(f"/v1/posts/{post_id}/analytics")
+
+        results = await asyncio.gather(*(fetch(p) for p in post_ids), return_exceptions=True)
+
+        analytics: list[dict | Exception] = []
+        for result in results:
+            # Cancellation and other BaseExceptions are not per-post failures
+            if not isinstance(result, (dict, Exception)):
+                raise result
+            analytics.append(result)
+        return analytics
 
     async def delete_post(self, post_id: str) -> bool:
         """Delete a post."""
-        response = await self.client.delete(f"/v1/posts/{post_id}")
+        response = await self._request("DELETE", f"/v1/posts/{post_id}")
         return response.status_code in (200, 204)
 
     async def get_scheduled_posts(self) -> list[dict]:
         """Get all scheduled posts."""
-        response = await self.client.get("/v1/posts", params={"status": "scheduled"})
-        response.raise_for_status()
-        return response.json().get("data", [])
+        data = await self._get_json("/v1/posts", params={"status": "scheduled"})
+        return data.get("data", [])
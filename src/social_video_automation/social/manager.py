@@ -1,22 +1,44 @@
 """Social Manager - Orchestrates social media posting."""
 
+import asyncio
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 import structlog
 
 from social_video_automation.config import get_settings
+from social_video_automation.social._http import close_http_client
 from social_video_automation.social.ayrshare import AyrsharePoster
 from social_video_automation.social.base import (
     PostRequest,
     PostResult,
-    SocialPlatform,
     SocialPoster,
+    to_platform,
 )
 from social_video_automation.social.late import LatePoster
 
 logger = structlog.get_logger()
 
+_TZ = ZoneInfo("Australia/Melbourne")
+
+# Platform-specific optimal posting hours (AEDT)
+OPTIMAL_HOURS = {
+    "instagram": 12,  # Noon
+    "tiktok": 19,  # 7 PM
+    "youtube": 15,  # 3 PM
+    "facebook": 13,  # 1 PM
+}
+
+
+def _next_at_hour(now: datetime, hour: int) -> datetime:
+    """Get the next occurrence of hour:00 after now."""
+    scheduled = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+
+    # If the time has passed today, schedule for tomorrow
+    if scheduled <= now:
+        scheduled += timedelta(days=1)
+    return scheduled
+
 
 class SocialManager:
     """Manages social media posting across services."""
@@ -27,22 +49,31 @@ class SocialManager:
             "ayrshare": AyrsharePoster(),
             "late": LatePoster(),
         }
+        # Backpressure against posting API rate limits, shared by every post call
+        self._post_sem = asyncio.Semaphore(self.settings.social.max_concurrent_posts)
+
+    async def aclose(self) -> None:
+        """Close the HTTP connections shared by the posters."""
+        await close_http_client()
 
     async def get_available_posters(self) -> list[str]:
         """Get list of available social media posters."""
-        available = []
-        for name, poster in self.posters.items():
-            if await poster.is_available():
-                available.append(name)
-        return available
+        checks = await asyncio.gather(*(p.is_available() for p in self.posters.values()))
+        return [name for name, ok in zip(self.posters, checks, strict=True) if ok]
 
     async def get_all_connected_accounts(self) -> dict[str, list[dict]]:
         """Get connected accounts from all available posters."""
-        accounts = {}
-        for name, poster in self.posters.items():
-            if await poster.is_available():
-                accounts[name] = await poster.get_connected_accounts()
-        return accounts
+        async def fetch(poster: SocialPoster) -> list[dict] | None:
+            if not await poster.is_available():
+                return None
+            return await poster.get_connected_accounts()
+
+        results = await asyncio.gather(*(fetch(p) for p in self.posters.values()))
+        return {
+            name: accounts
+            for name, accounts in zip(self.posters, results, strict=True)
+            if accounts is not None
+        }
 
     async def post(
         self,
@@ -53,27 +84,30 @@ class SocialManager:
         scheduled_time: datetime | None = None,
         preferred_poster: str | None = None,
         youtube_title: str = "",
+        scheduled_times: dict[str, datetime] | None = None,
     ) -> list[PostResult]:
-        """Post content to social media platforms."""
-        available = await self.get_available_posters()
+        """Post content to social media platforms.
+
+        ``scheduled_times`` overrides ``scheduled_time`` for individual platforms.
+        """
+        # Select poster; a usable preferred poster skips probing the others
+        preferred = self.posters.get(preferred_poster) if preferred_poster else None
+        if preferred is not None and await preferred.is_available():
+            poster = preferred
+        else:
+            available = await self.get_available_posters()
 
-        if not available:
-            raise RuntimeError("No social media posters available. Check API configuration.")
+            if not available:
+                raise RuntimeError("No social media posters available. Check API configuration.")
 
-        # Select poster
-        if preferred_poster and preferred_poster in available:
-            poster_name = preferred_poster
-        else:
             # Prefer Ayrshare for multi-platform posting
-            poster_name = "ayrshare" if "ayrshare" in available else available[0]
-
-        poster = self.posters[poster_name]
+            poster = self.posters["ayrshare" if "ayrshare" in available else available[0]]
 
         # Convert platform strings to enum
         if platforms is None:
             platforms = self.settings.social.target_platforms
 
-        platform_enums = [SocialPlatform(p) for p in platforms]
+        platform_enums = [to_platform(p) for p in platforms]
 
         # Build request
         request = PostRequest(
@@ -82,17 +116,21 @@ class SocialManager:
             hashtags=hashtags or [],
             video_url=video_url,
             scheduled_time=scheduled_time,
+            scheduled_times={
+                to_platform(p): t for p, t in (scheduled_times or {}).items()
+            },
             youtube_options={"title": youtube_title} if youtube_title else {},
         )
 
         logger.info(
             "Posting to social media",
-            poster=poster_name,
+            poster=poster.poster_name,
             platforms=platforms,
-            scheduled=scheduled_time is not None,
+            scheduled=scheduled_time is not None or bool(scheduled_times),
         )
 
-        results = await poster.post(request)
+        async with self._post_sem:
+            results = await poster.post(request)
 
         # Log results
         for result in results:
@@ -126,39 +164,26 @@ class SocialManager:
             platforms = self.settings.social.target_platforms
 
         all_results = []
-        tz = ZoneInfo("Australia/Melbourne")
+        now = datetime.now(_TZ)
 
         if schedule == "optimal":
-            # Platform-specific optimal times (AEDT)
-            optimal_times = {
-                "instagram": 12,  # Noon
-                "tiktok": 19,  # 7 PM
-                "youtube": 15,  # 3 PM
-                "facebook": 13,  # 1 PM
+            scheduled_times = {
+                platform: _next_at_hour(now, OPTIMAL_HOURS.get(platform, 12))
+                for platform in platforms
             }
 
-            now = datetime.now(tz)
-            for platform in platforms:
-                optimal_hour = optimal_times.get(platform, 12)
-                scheduled = now.replace(hour=optimal_hour, minute=0, second=0, microsecond=0)
-
-                # If the time has passed today, schedule for tomorrow
-                if scheduled <= now:
-                    scheduled += timedelta(days=1)
-
-                results = await self.post(
-                    caption=caption,
-                    hashtags=hashtags,
-                    video_url=video_url,
-                    platforms=[platform],
-                    scheduled_time=scheduled,
-                )
-                all_results.extend(results)
+            # One post carries every platform's time
+            results = await self.post(
+                caption=caption,
+                hashtags=hashtags,
+                video_url=video_url,
+                platforms=platforms,
+                scheduled_times=scheduled_times,
+            )
+            all_results.extend(results)
 
         elif schedule == "morning":
-            scheduled = datetime.now(tz).replace(hour=9, minute=0, second=0, microsecond=0)
-            if scheduled <= datetime.now(tz):
-                scheduled += timedelta(days=1)
+            scheduled = _next_at_hour(now, 9)
 
             results = await self.post(
                 caption=caption,
@@ -170,9 +195,7 @@ class SocialManager:
             all_results.extend(results)
 
         elif schedule == "evening":
-            scheduled = datetime.now(tz).replace(hour=19, minute=0, second=0, microsecond=0)
-            if scheduled <= datetime.now(tz):
-                scheduled += timedelta(days=1)
+            scheduled = _next_at_hour(now, 19)
 
             results = await self.post(
                 caption=caption,
@@ -184,16 +207,17 @@ class SocialManager:
             all_results.extend(results)
 
         elif schedule == "custom" and custom_times:
-            for platform, time in custom_times.items():
-                if platform in platforms:
-                    results = await self.post(
-                        caption=caption,
-                        hashtags=hashtags,
-                        video_url=video_url,
-                        platforms=[platform],
-                        scheduled_time=time,
-                    )
-                    all_results.extend(results)
+            scheduled_times = {p: t for p, t in custom_times.items() if p in platforms}
+            if scheduled_times:
+                # One post carries every platform's time; posters fan out concurrently
+                results = await self.post(
+                    caption=caption,
+                    hashtags=hashtags,
+                    video_url=video_url,
+                    platforms=list(scheduled_times),
+                    scheduled_times=scheduled_times,
+                )
+                all_results.extend(results)
 
         return all_results
 
@@ -1,6 +1,8 @@
 """Proven content formulas for viral social media content."""
 
-CONTENT_FORMULAS = {
+from social_video_automation.templates._frozen import freeze
+
+CONTENT_FORMULAS = freeze({
     "problem_agitate_solve": {
         "description": "Identify a problem, agitate it, then present solution",
         "structure": [
@@ -93,10 +95,10 @@ CONTENT_FORMULAS = {
         },
         "best_for": ["lifestyle", "authentic_content"],
     },
-}
+})
 
 # Content pillars for PeterMat
-CONTENT_PILLARS = {
+CONTENT_PILLARS = freeze({
     "product": {
         "weight": 0.3,  # 30% of content
         "types": [
@@ -142,18 +144,18 @@ CONTENT_PILLARS = {
             "team",
         ],
     },
-}
+})
 
 # Optimal posting frequency
-POSTING_SCHEDULE = {
+POSTING_SCHEDULE = freeze({
     "tiktok": {"daily": 2, "weekly": 14},
     "instagram_reels": {"daily": 1, "weekly": 7},
     "youtube_shorts": {"daily": 1, "weekly": 5},
     "facebook": {"daily": 1, "weekly": 5},
-}
+})
 
 # Engagement tactics
-ENGAGEMENT_TACTICS = {
+ENGAGEMENT_TACTICS = freeze({
     "call_to_action": [
         "Double tap if you agree!",
         "Save this for later",
@@ -177,4 +179,4 @@ ENGAGEMENT_TACTICS = {
         "Unpopular opinion:",
         "Change my mind:",
     ],
-}
+})
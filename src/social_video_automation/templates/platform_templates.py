@@ -1,6 +1,8 @@
 """Platform-specific content templates for PeterMat."""
 
-PLATFORM_TEMPLATES = {
+from social_video_automation.templates._frozen import freeze
+
+PLATFORM_TEMPLATES = freeze({
     "tiktok": {
         "video_specs": {
             "aspect_ratio": "9:16",
@@ -121,19 +123,19 @@ PLATFORM_TEMPLATES = {
             "live_events",
         ],
     },
-}
+})
 
 # PeterMat branded hashtags
-BRANDED_HASHTAGS = [
+BRANDED_HASHTAGS = freeze([
     "#PeterMat",
     "#BornFromTheLand",
     "#BuiltForPerformance",
     "#AussieAthlete",
     "#PeterMatGear",
-]
+])
 
 # Australian sports niche hashtags
-NICHE_HASHTAGS = {
+NICHE_HASHTAGS = freeze({
     "cricket": [
         "#AustraliaCricket",
         "#CricketAustralia",
@@ -167,10 +169,10 @@ NICHE_HASHTAGS = {
         "#AustralianMade",
         "#SupportLocal",
     ],
-}
+})
 
 # Location hashtags
-LOCATION_HASHTAGS = [
+LOCATION_HASHTAGS = freeze([
     "#Sydney",
     "#Melbourne",
     "#Brisbane",
@@ -179,4 +181,4 @@ LOCATION_HASHTAGS = [
     "#Australia",
     "#DownUnder",
     "#Straya",
-]
+])
@@ -1,6 +1,8 @@
 """Viral hook templates proven to drive engagement."""
 
-VIRAL_HOOKS = {
+from social_video_automation.templates._frozen import freeze
+
+VIRAL_HOOKS = freeze({
     "curiosity_gap": [
         "You won't believe what happened when...",
         "I tested {product} for 30 days and...",
@@ -47,10 +49,10 @@ VIRAL_HOOKS = {
         "Outback-tested, city-approved",
         "Fair dinkum sports gear review",
     ],
-}
+})
 
 # Platform-specific hook styles
-HOOK_STYLES = {
+HOOK_STYLES = freeze({
     "tiktok": {
         "max_length": 50,
         "style": "punchy",
@@ -75,4 +77,4 @@ HOOK_STYLES = {
         "emoji_use": "moderate",
         "preferred_types": ["storytelling", "australian_sports", "transformation"],
     },
-}
+})
@@ -1,9 +1,21 @@
 """Video generation module using Creatomate and HeyGen."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from social_video_automation.video.base import VideoGenerator, VideoRequest, VideoResult
-from social_video_automation.video.creatomate import CreatomateGenerator
-from social_video_automation.video.heygen import HeyGenGenerator
-from social_video_automation.video.manager import VideoManager
+
+if TYPE_CHECKING:
+    from social_video_automation.video.creatomate import CreatomateGenerator
+    from social_video_automation.video.heygen import HeyGenGenerator
+    from social_video_automation.video.manager import VideoManager
+
+# Backends are imported on first access so importing the package stays cheap
+_LAZY_IMPORTS = {
+    "CreatomateGenerator": "social_video_automation.video.creatomate",
+    "HeyGenGenerator": "social_video_automation.video.heygen",
+    "VideoManager": "social_video_automation.video.manager",
+}
 
 __all__ = [
     "VideoGenerator",
@@ -13,3 +25,13 @@ __all__ = [
     "HeyGenGenerator",
     "VideoManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a backend class the first time it is accessed (PEP 562)."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,32 @@
+"""Shared HTTP connection pool for video generators."""
+
+import httpx
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP/2 client shared by Creatomate, HeyGen and downloads.
+
+    Generators pass full URLs and their own auth headers on each request.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=60,
+            ),
+        )
+    return _shared_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
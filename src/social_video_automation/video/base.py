@@ -23,7 +23,7 @@ class AspectRatio(str, Enum):
     PORTRAIT_4_5 = "4:5"  # Instagram Feed
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoRequest:
     """Request for video generation."""
 
@@ -50,8 +50,17 @@ class VideoRequest:
     # AI-generated visuals
     image_prompts: list[str] = field(default_factory=list)
 
+    # Derived from resolution/aspect_ratio once, in __post_init__
+    width: int = field(init=False, repr=False, compare=False)
+    height: int = field(init=False, repr=False, compare=False)
+    aspect_ratio_x: str = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self) -> None:
+        self.width, self.height = map(int, self.resolution.split("x"))
+        self.aspect_ratio_x = self.aspect_ratio.value.replace(":", "x")
+
+
+@dataclass(slots=True)
 class VideoResult:
     """Result from video generation."""
 
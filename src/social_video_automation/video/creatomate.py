@@ -1,11 +1,17 @@
 """Creatomate video generation service."""
 
 import asyncio
+import random
+import time
+from types import MappingProxyType
+from typing import Any
 
 import httpx
+import orjson
 import structlog
 
 from social_video_automation.config import get_settings
+from social_video_automation.video._http import get_http_client
 from social_video_automation.video.base import (
     VideoFormat,
     VideoGenerator,
@@ -17,46 +23,85 @@ logger = structlog.get_logger()
 
 CREATOMATE_API_URL = "https://api.creatomate.com/v1"
 
+# Fixed parts of the dynamic composition; per-request fields are merged in
+_TEXT_ELEMENT_TEMPLATE = MappingProxyType({
+    "type": "text",
+    "font_family": "Inter",
+    "font_weight": "600",
+    "font_size": "48 vmin",
+    "x": "50%",
+    "y": "50%",
+    "x_anchor": "50%",
+    "y_anchor": "50%",
+    "animations": ({"type": "text-appear", "time": "start", "duration": 1},),
+})
+
+_BACKGROUND_TEMPLATE = MappingProxyType({
+    "type": "shape",
+    "shape": "rectangle",
+    "width": "100%",
+    "height": "100%",
+})
+
 
 class CreatomateGenerator(VideoGenerator):
     """Video generator using Creatomate API."""
 
     generator_name = "creatomate"
 
+    # Seconds to reuse the template listing
+    CATALOG_TTL = 600.0
+
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._client: httpx.AsyncClient | None = None
+        self._api_key = self.settings.video.creatomate_api_key
+        self._headers = {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+        }
+        self._templates_cache: tuple[float, list[dict]] | None = None
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Lazy-loaded HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=CREATOMATE_API_URL,
-                headers={
-                    "Authorization": f"Bearer {self.settings.video.creatomate_api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=60.0,
-            )
-        return self._client
+        """HTTP client shared by all video generators."""
+        return get_http_client()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send an authenticated request to the Creatomate API."""
+        return await self.client.request(
+            method, f"{CREATOMATE_API_URL}{path}", headers=self._headers, **kwargs
+        )
 
     async def is_available(self) -> bool:
         """Check if Creatomate is available."""
-        if not self.settings.video.creatomate_api_key:
+        if not self._api_key:
             return False
         try:
-            response = await self.client.get("/templates")
+            # HEAD avoids downloading the listing; fall back to a one-item GET
+            response = await self._request("HEAD", "/templates")
+            if response.status_code == 405:
+                response = await self._request("GET", "/templates", params={"limit": 1})
             return response.status_code == 200
         except Exception as e:
             logger.warning("Creatomate unavailable", error=str(e))
             return False
 
     async def list_templates(self) -> list[dict]:
-        """List available Creatomate templates."""
-        response = await self.client.get("/templates")
+        """List available Creatomate templates, cached for CATALOG_TTL seconds."""
+        if self._templates_cache is not None:
+            fetched_at, templates = self._templates_cache
+            if time.monotonic() - fetched_at < self.CATALOG_TTL:
+                return templates
+
+        response = await self._request("GET", "/templates")
         response.raise_for_status()
-        return response.json()
+        templates = orjson.loads(response.content)
+        self._templates_cache = (time.monotonic(), templates)
+        return templates
+
+    def invalidate_catalog(self) -> None:
+        """Drop the cached template listing so the next call refetches it."""
+        self._templates_cache = None
 
     async def generate(self, request: VideoRequest) -> VideoResult:
         """Generate video using Creatomate."""
@@ -64,9 +109,9 @@ class CreatomateGenerator(VideoGenerator):
         render_data = self._build_render_request(request)
 
         # Start the render job
-        response = await self.client.post("/renders", json=render_data)
+        response = await self._request("POST", "/renders", content=orjson.dumps(render_data))
         response.raise_for_status()
-        render_info = response.json()
+        render_info = orjson.loads(response.content)
 
         render_id = render_info[0]["id"] if isinstance(render_info, list) else render_info["id"]
 
@@ -100,29 +145,16 @@ class CreatomateGenerator(VideoGenerator):
 
         # Add text elements from script
         text_element = {
-            "type": "text",
+            **_TEXT_ELEMENT_TEMPLATE,
             "text": request.script[:500],  # Limit text length
-            "font_family": "Inter",
-            "font_weight": "600",
-            "font_size": "48 vmin",
             "fill_color": request.brand_colors.get("primary", "#FFFFFF"),
-            "x": "50%",
-            "y": "50%",
-            "x_anchor": "50%",
-            "y_anchor": "50%",
-            "animations": [
-                {"type": "text-appear", "time": "start", "duration": 1}
-            ],
         }
         elements.append(text_element)
 
         # Add background
         background = {
-            "type": "shape",
-            "shape": "rectangle",
+            **_BACKGROUND_TEMPLATE,
             "fill_color": request.brand_colors.get("secondary", "#1A1A2E"),
-            "width": "100%",
-            "height": "100%",
         }
 
         # Add logo if provided
@@ -157,8 +189,8 @@ class CreatomateGenerator(VideoGenerator):
         return {
             "source": {
                 "output_format": request.format.value,
-                "width": int(request.resolution.split("x")[0]),
-                "height": int(request.resolution.split("x")[1]),
+                "width": request.width,
+                "height": request.height,
                 "duration": request.duration,
                 "frame_rate": request.fps,
                 "elements": [background] + elements + audio_elements,
@@ -169,14 +201,15 @@ class CreatomateGenerator(VideoGenerator):
         self,
         render_id: str,
         timeout: int = 300,
-        poll_interval: int = 5,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 15.0,
     ) -> dict:
-        """Wait for render to complete."""
-        elapsed = 0
-        while elapsed < timeout:
-            response = await self.client.get(f"/renders/{render_id}")
+        """Wait for render to complete, backing off with jitter between polls."""
+        deadline = time.monotonic() + timeout
+        while True:
+            response = await self._request("GET", f"/renders/{render_id}")
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             status = result.get("status")
             logger.info("Render status", render_id=render_id, status=status)
@@ -186,13 +219,16 @@ class CreatomateGenerator(VideoGenerator):
             elif status == "failed":
                 raise RuntimeError(f"Render failed: {result.get('error_message')}")
 
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(poll_interval * random.uniform(0.8, 1.2), remaining))
+            poll_interval = min(poll_interval * 2, max_poll_interval)
 
         raise TimeoutError(f"Render {render_id} timed out after {timeout} seconds")
 
     async def get_status(self, video_id: str) -> dict:
         """Get render status."""
-        response = await self.client.get(f"/renders/{video_id}")
+        response = await self._request("GET", f"/renders/{video_id}")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
@@ -1,11 +1,16 @@
 """HeyGen video generation service for AI avatar videos."""
 
 import asyncio
+import random
+import time
+from typing import Any
 
 import httpx
+import orjson
 import structlog
 
 from social_video_automation.config import get_settings
+from social_video_automation.video._http import get_http_client
 from social_video_automation.video.base import (
     VideoFormat,
     VideoGenerator,
@@ -23,30 +28,38 @@ class HeyGenGenerator(VideoGenerator):
 
     generator_name = "heygen"
 
+    # Seconds to reuse template/avatar/voice listings
+    CATALOG_TTL = 600.0
+
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._client: httpx.AsyncClient | None = None
+        self._api_key = self.settings.video.heygen_api_key
+        self._headers = {
+            "X-Api-Key": self._api_key,
+            "Content-Type": "application/json",
+        }
+        self._catalog: dict[str, tuple[float, list[dict]]] = {}
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Lazy-loaded HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=HEYGEN_API_URL,
-                headers={
-                    "X-Api-Key": self.settings.video.heygen_api_key,
-                    "Content-Type": "application/json",
-                },
-                timeout=60.0,
-            )
-        return self._client
+        """HTTP client shared by all video generators."""
+        return get_http_client()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send an authenticated request to the HeyGen API."""
+        return await self.client.request(
+            method, f"{HEYGEN_API_URL}{path}", headers=self._headers, **kwargs
+        )
 
     async def is_available(self) -> bool:
         """Check if HeyGen is available."""
-        if not self.settings.video.heygen_api_key:
+        if not self._api_key:
             return False
         try:
-            response = await self.client.get("/avatars")
+            # HEAD avoids downloading the listing; fall back to a one-item GET
+            response = await self._request("HEAD", "/avatars")
+            if response.status_code == 405:
+                response = await self._request("GET", "/avatars", params={"limit": 1})
             return response.status_code == 200
         except Exception as e:
             logger.warning("HeyGen unavailable", error=str(e))
@@ -54,33 +67,40 @@ class HeyGenGenerator(VideoGenerator):
 
     async def list_templates(self) -> list[dict]:
         """List available HeyGen templates."""
-        response = await self.client.get("/templates")
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", {}).get("templates", [])
+        return await self._get_catalog("templates")
 
     async def list_avatars(self) -> list[dict]:
         """List available AI avatars."""
-        response = await self.client.get("/avatars")
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", {}).get("avatars", [])
+        return await self._get_catalog("avatars")
 
     async def list_voices(self) -> list[dict]:
         """List available voices."""
-        response = await self.client.get("/voices")
+        return await self._get_catalog("voices")
+
+    def invalidate_catalog(self) -> None:
+        """Drop cached listings so the next call refetches them."""
+        self._catalog.clear()
+
+    async def _get_catalog(self, name: str) -> list[dict]:
+        """Fetch a listing endpoint, cached for CATALOG_TTL seconds."""
+        cached = self._catalog.get(name)
+        if cached is not None and time.monotonic() - cached[0] < self.CATALOG_TTL:
+            return cached[1]
+
+        response = await self._request("GET", f"/{name}")
         response.raise_for_status()
-        data = response.json()
-        return data.get("data", {}).get("voices", [])
+        items = orjson.loads(response.content).get("data", {}).get(name, [])
+        self._catalog[name] = (time.monotonic(), items)
+        return items
 
     async def generate(self, request: VideoRequest) -> VideoResult:
         """Generate AI avatar video using HeyGen."""
         video_data = self._build_video_request(request)
 
         # Create video
-        response = await self.client.post("/video/generate", json=video_data)
+        response = await self._request("POST", "/video/generate", content=orjson.dumps(video_data))
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content)
 
         video_id = result.get("data", {}).get("video_id")
         if not video_id:
@@ -102,9 +122,6 @@ class HeyGenGenerator(VideoGenerator):
 
     def _build_video_request(self, request: VideoRequest) -> dict:
         """Build HeyGen video request."""
-        # Parse resolution
-        width, height = map(int, request.resolution.split("x"))
-
         # Build video input
         video_input = {
             "character": {
@@ -133,24 +150,25 @@ class HeyGenGenerator(VideoGenerator):
         return {
             "video_inputs": [video_input],
             "dimension": {
-                "width": width,
-                "height": height,
+                "width": request.width,
+                "height": request.height,
             },
-            "aspect_ratio": request.aspect_ratio.value.replace(":", "x"),
+            "aspect_ratio": request.aspect_ratio_x,
         }
 
     async def _wait_for_completion(
         self,
         video_id: str,
         timeout: int = 600,  # HeyGen can take longer
-        poll_interval: int = 10,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
     ) -> dict:
-        """Wait for video generation to complete."""
-        elapsed = 0
-        while elapsed < timeout:
-            response = await self.client.get(f"/video_status.get?video_id={video_id}")
+        """Wait for video generation to complete, backing off with jitter between polls."""
+        deadline = time.monotonic() + timeout
+        while True:
+            response = await self._request("GET", f"/video_status.get?video_id={video_id}")
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             status = result.get("data", {}).get("status")
             logger.info("HeyGen video status", video_id=video_id, status=status)
@@ -161,13 +179,16 @@ class HeyGenGenerator(VideoGenerator):
                 error = result.get("data", {}).get("error")
                 raise RuntimeError(f"Video generation failed: {error}")
 
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(poll_interval * random.uniform(0.8, 1.2), remaining))
+            poll_interval = min(poll_interval * 2, max_poll_interval)
 
         raise TimeoutError(f"Video {video_id} timed out after {timeout} seconds")
 
     async def get_status(self, video_id: str) -> dict:
         """Get video generation status."""
-        response = await self.client.get(f"/video_status.get?video_id={video_id}")
+        response = await self._request("GET", f"/video_status.get?video_id={video_id}")
         response.raise_for_status()
-        return response.json().get("data", {})
+        return orjson.loads(response.content).get("data", {})
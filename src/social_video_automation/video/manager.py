@@ -1,12 +1,18 @@
 """Video Manager - Orchestrates video generation services."""
 
 import asyncio
+import contextlib
+import os
+import time
+from collections.abc import AsyncIterator
 from pathlib import Path
+from types import MappingProxyType
+from typing import BinaryIO, NamedTuple
 
-import httpx
 import structlog
 
 from social_video_automation.config import get_settings
+from social_video_automation.video._http import close_http_client, get_http_client
 from social_video_automation.video.base import (
     AspectRatio,
     VideoGenerator,
@@ -19,23 +25,42 @@ from social_video_automation.video.heygen import HeyGenGenerator
 logger = structlog.get_logger()
 
 
+class PlatformSpec(NamedTuple):
+    """Aspect ratio, duration in seconds and resolution used for a platform."""
+
+    aspect_ratio: AspectRatio
+    duration: int
+    resolution: str
+
+
+DEFAULT_SPEC = PlatformSpec(AspectRatio.PORTRAIT_9_16, 30, "1080x1920")
+
+# Bytes read from the network per write when downloading videos
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _preallocate(f: BinaryIO, size: int) -> None:
+    """Reserve disk space for a download up front to limit fragmentation."""
+    if not hasattr(os, "posix_fallocate"):
+        return
+    # If the filesystem doesn't support it, the file just grows as written
+    with contextlib.suppress(OSError):
+        os.posix_fallocate(f.fileno(), 0, size)
+
+
 class VideoManager:
     """Manages video generation across multiple services."""
 
-    PLATFORM_ASPECT_RATIOS = {
-        "instagram": AspectRatio.PORTRAIT_9_16,
-        "tiktok": AspectRatio.PORTRAIT_9_16,
-        "youtube": AspectRatio.PORTRAIT_9_16,  # For Shorts
-        "youtube_long": AspectRatio.LANDSCAPE_16_9,
-        "facebook": AspectRatio.PORTRAIT_9_16,
-    }
-
-    PLATFORM_DURATIONS = {
-        "instagram": 30,
-        "tiktok": 30,
-        "youtube": 60,
-        "facebook": 30,
-    }
+    PLATFORM_SPEC = MappingProxyType({
+        "instagram": DEFAULT_SPEC,
+        "tiktok": DEFAULT_SPEC,
+        "youtube": PlatformSpec(AspectRatio.PORTRAIT_9_16, 60, "1080x1920"),  # For Shorts
+        "youtube_long": PlatformSpec(AspectRatio.LANDSCAPE_16_9, 30, "1920x1080"),
+        "facebook": DEFAULT_SPEC,
+    })
+
+    # Seconds to reuse a generator availability check
+    AVAILABILITY_TTL = 60.0
 
     def __init__(self) -> None:
         self.settings = get_settings()
@@ -44,14 +69,39 @@ class VideoManager:
             "heygen": HeyGenGenerator(),
         }
         self.output_dir = Path("output/videos")
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_ready = False  # output_dir is created on first download
+        self._avail_cache: dict[str, tuple[float, bool]] = {}
+        self._avail_lock = asyncio.Lock()
+        # Backpressure against provider rate limits, shared by every render
+        self._render_sem = asyncio.Semaphore(self.settings.video.max_concurrent_renders)
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool shared by the video generators."""
+        await close_http_client()
 
     async def get_available_generators(self) -> list[str]:
-        """Get list of available video generators."""
-        available = []
-        for name, generator in self.generators.items():
-            if await generator.is_available():
-                available.append(name)
+        """Get list of available video generators, cached for AVAILABILITY_TTL seconds."""
+        async with self._avail_lock:
+            checks = await asyncio.gather(*(self._is_available(name) for name in self.generators))
+        return [name for name, ok in zip(self.generators, checks, strict=True) if ok]
+
+    def invalidate_availability(self) -> None:
+        """Forget cached availability checks, e.g. after API keys change."""
+        self._avail_cache.clear()
+
+    async def _is_available(self, name: str) -> bool:
+        """Check a single generator, reusing a recent result."""
+        cached = self._avail_cache.get(name)
+        if cached is not None and time.monotonic() - cached[0] < self.AVAILABILITY_TTL:
+            return cached[1]
+
+        try:
+            available = await self.generators[name].is_available() is True
+        except Exception as e:
+            logger.warning("Video generator unavailable", generator=name, error=str(e))
+            available = False
+
+        self._avail_cache[name] = (time.monotonic(), available)
         return available
 
     async def generate_video(
@@ -64,106 +114,162 @@ class VideoManager:
         download: bool = True,
     ) -> VideoResult:
         """Generate a video for the specified platform."""
+        generator_name = await self._select_generator(preferred_generator)
+        request = self._build_request(script, platform, title, voiceover_text)
+        return await self._render(generator_name, request, download)
+
+    async def generate_for_all_platforms(
+        self,
+        script: str,
+        title: str = "",
+        voiceover_text: str | None = None,
+        platforms: list[str] | None = None,
+    ) -> dict[str, VideoResult]:
+        """Generate videos for multiple platforms, rendering each distinct spec once."""
+        return {
+            platform: result
+            async for platform, result in self.generate_for_all_platforms_streaming(
+                script=script,
+                title=title,
+                voiceover_text=voiceover_text,
+                platforms=platforms,
+            )
+        }
+
+    async def generate_for_all_platforms_streaming(
+        self,
+        script: str,
+        title: str = "",
+        voiceover_text: str | None = None,
+        platforms: list[str] | None = None,
+    ) -> AsyncIterator[tuple[str, VideoResult]]:
+        """Yield (platform, result) pairs as soon as each render and download finishes.
+
+        Platforms sharing a spec share one render and are yielded together.
+        Failed renders are logged and not yielded.
+        """
+        if platforms is None:
+            platforms = self.settings.social.target_platforms
+
+        # One availability check and selection for the whole fan-out
+        try:
+            generator_name = await self._select_generator()
+        except RuntimeError as e:
+            logger.error("Video generation failed", platforms=platforms, error=str(e))
+            return
+
+        # Platforms sharing a spec get the same render; the first one names the job
+        groups: dict[PlatformSpec, list[str]] = {}
+        for platform in dict.fromkeys(platforms):
+            groups.setdefault(self.PLATFORM_SPEC.get(platform, DEFAULT_SPEC), []).append(platform)
+
+        async def render(group: list[str]) -> tuple[list[str], VideoResult | Exception]:
+            request = self._build_request(script, group[0], title, voiceover_text)
+            try:
+                return group, await self._render(generator_name, request, download=True)
+            except Exception as e:
+                return group, e
+
+        tasks = [asyncio.create_task(render(group)) for group in groups.values()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                group, result = await next_done
+                for platform in group:
+                    if isinstance(result, VideoResult):
+                        logger.info("Video generated", platform=platform, url=result.video_url)
+                        yield platform, result
+                    else:
+                        logger.error(
+                            "Video generation failed", platform=platform, error=str(result)
+                        )
+        finally:
+            # The caller may stop iterating early
+            for task in tasks:
+                task.cancel()
+
+    async def _select_generator(self, preferred_generator: str | None = None) -> str:
+        """Pick an available generator, honouring the preference when possible."""
         available = await self.get_available_generators()
 
         if not available:
             raise RuntimeError("No video generators available. Check API configuration.")
 
-        # Select generator
         if preferred_generator and preferred_generator in available:
-            generator_name = preferred_generator
-        else:
-            # Prefer Creatomate for quick generation, HeyGen for avatar videos
-            generator_name = "creatomate" if "creatomate" in available else available[0]
-
-        generator = self.generators[generator_name]
+            return preferred_generator
+        # Prefer Creatomate for quick generation, HeyGen for avatar videos
+        return "creatomate" if "creatomate" in available else available[0]
 
-        # Build request with platform-specific settings
-        request = VideoRequest(
+    def _build_request(
+        self,
+        script: str,
+        platform: str,
+        title: str,
+        voiceover_text: str | None,
+    ) -> VideoRequest:
+        """Build a request with platform-specific settings."""
+        spec = self.PLATFORM_SPEC.get(platform, DEFAULT_SPEC)
+        return VideoRequest(
             script=script,
             platform=platform,
             title=title,
-            aspect_ratio=self.PLATFORM_ASPECT_RATIOS.get(
-                platform, AspectRatio.PORTRAIT_9_16
-            ),
-            duration=self.PLATFORM_DURATIONS.get(platform, 30),
-            resolution=self._get_resolution_for_aspect(
-                self.PLATFORM_ASPECT_RATIOS.get(platform, AspectRatio.PORTRAIT_9_16)
-            ),
+            aspect_ratio=spec.aspect_ratio,
+            duration=spec.duration,
+            resolution=spec.resolution,
             voiceover_text=voiceover_text,
             brand_colors=self.settings.brand.colors,
         )
 
+    async def _render(
+        self,
+        generator_name: str,
+        request: VideoRequest,
+        download: bool,
+    ) -> VideoResult:
+        """Render a request with the named generator, then optionally download it."""
         logger.info(
             "Generating video",
             generator=generator_name,
-            platform=platform,
+            platform=request.platform,
             duration=request.duration,
         )
 
-        result = await generator.generate(request)
+        async with self._render_sem:
+            result = await self.generators[generator_name].generate(request)
 
         # Download video if requested
         if download and result.video_url:
-            local_path = await self._download_video(result)
-            result.local_path = local_path
+            result.local_path = await self._download_video(result)
 
         return result
 
-    async def generate_for_all_platforms(
-        self,
-        script: str,
-        title: str = "",
-        voiceover_text: str | None = None,
-        platforms: list[str] | None = None,
-    ) -> dict[str, VideoResult]:
-        """Generate videos for multiple platforms."""
-        if platforms is None:
-            platforms = self.settings.social.target_platforms
-
-        results = {}
-        tasks = [
-            self.generate_video(
-                script=script,
-                platform=platform,
-                title=title,
-                voiceover_text=voiceover_text,
-            )
-            for platform in platforms
-        ]
-
-        generated = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for platform, result in zip(platforms, generated):
-            if isinstance(result, VideoResult):
-                results[platform] = result
-                logger.info("Video generated", platform=platform, url=result.video_url)
-            else:
-                logger.error("Video generation failed", platform=platform, error=str(result))
-
-        return results
-
-    def _get_resolution_for_aspect(self, aspect_ratio: AspectRatio) -> str:
-        """Get resolution string for aspect ratio."""
-        resolutions = {
-            AspectRatio.PORTRAIT_9_16: "1080x1920",
-            AspectRatio.SQUARE_1_1: "1080x1080",
-            AspectRatio.LANDSCAPE_16_9: "1920x1080",
-            AspectRatio.PORTRAIT_4_5: "1080x1350",
-        }
-        return resolutions.get(aspect_ratio, "1080x1920")
-
     async def _download_video(self, result: VideoResult) -> Path:
         """Download video to local storage."""
+        if not self._output_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_ready = True
+
         filename = f"{result.video_id}.{result.format.value}"
         local_path = self.output_dir / filename
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(result.video_url, follow_redirects=True)
+        client = get_http_client()
+        async with client.stream("GET", result.video_url, follow_redirects=True) as response:
             response.raise_for_status()
 
-            with open(local_path, "wb") as f:
-                f.write(response.content)
+            expected_size = int(response.headers.get("content-length") or 0)
+
+            f = await asyncio.to_thread(open, local_path, "wb")
+            try:
+                with f:
+                    if expected_size:
+                        await asyncio.to_thread(_preallocate, f, expected_size)
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                    # Drop any reserved space the decoded body didn't fill
+                    await asyncio.to_thread(f.truncate)
+            except BaseException:
+                # Don't leave a partial download behind
+                local_path.unlink(missing_ok=True)
+                raise
 
         logger.info("Video downloaded", path=str(local_path))
         return local_path
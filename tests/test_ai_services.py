@@ -1,8 +1,20 @@
 """Tests for AI services."""
 
+import asyncio
+import json
+from types import SimpleNamespace
+
 import pytest
 
-from social_video_automation.ai_services.base import ContentRequest, ContentType
+from social_video_automation.ai_services import _http
+from social_video_automation.ai_services.base import (
+    VIDEO_PACKAGE_FIELDS,
+    ContentRequest,
+    ContentResponse,
+    ContentType,
+)
+from social_video_automation.ai_services.chatgpt import ChatGPTService
+from social_video_automation.ai_services.orchestrator import AIOrchestrator
 
 
 class TestContentRequest:
@@ -37,6 +49,15 @@ class TestContentRequest:
         assert request.brand_context["name"] == "PeterMat"
         assert "sporty" in request.brand_context["tone"]
 
+    def test_max_tokens(self):
+        """Test a video package gets a token budget for each of its fields."""
+        single = ContentRequest(ContentType.CAPTION, "topic", "instagram")
+        package = ContentRequest(ContentType.VIDEO_PACKAGE, "topic", "instagram")
+        limited = ContentRequest(ContentType.VIDEO_PACKAGE, "topic", "instagram", max_length=200)
+
+        assert package.max_tokens == single.max_tokens * len(VIDEO_PACKAGE_FIELDS)
+        assert limited.max_tokens == 200
+
 
 class TestContentType:
     """Tests for ContentType enum."""
@@ -48,3 +69,296 @@ class TestContentType:
         assert ContentType.HASHTAGS.value == "hashtags"
         assert ContentType.THUMBNAIL_PROMPT.value == "thumbnail_prompt"
         assert ContentType.CONTENT_IDEA.value == "content_idea"
+        assert ContentType.VIDEO_PACKAGE.value == "video_package"
+
+
+def _package_response(content: str) -> ContentResponse:
+    return ContentResponse(
+        content=content,
+        content_type=ContentType.VIDEO_PACKAGE,
+        ai_service="chatgpt",
+        tokens_used=42,
+    )
+
+
+class TestVideoPackage:
+    """Tests for splitting and completing batched video packages."""
+
+    def test_split_valid_package(self):
+        """Test every field of a complete package is split out."""
+        data = {ct.value: f"{ct.value} text" for ct in VIDEO_PACKAGE_FIELDS}
+        data["hashtags"] = ["#cricket", "#aussie"]
+
+        package = AIOrchestrator()._split_video_package(_package_response(json.dumps(data)))
+
+        assert set(package) == {ct.value for ct in VIDEO_PACKAGE_FIELDS}
+        assert package["hashtags"].content == "#cricket #aussie"
+        assert package["video_script"].tokens_used == 42
+        assert package["caption"].tokens_used == 0
+
+    def test_split_truncated_package(self):
+        """Test truncated JSON is rejected."""
+        with pytest.raises(ValueError):
+            AIOrchestrator()._split_video_package(
+                _package_response('{"video_script": "Open on the oval')
+            )
+
+    def test_split_partial_package(self):
+        """Test missing and empty fields are left out."""
+        content = json.dumps({"video_script": "script", "caption": ""})
+
+        package = AIOrchestrator()._split_video_package(_package_response(content))
+
+        assert list(package) == ["video_script"]
+
+    async def test_missing_fields_requested_separately(self, monkeypatch):
+        """Test only the content types missing from the package are re-requested."""
+        orchestrator = AIOrchestrator()
+        requested: list[ContentType] = []
+
+        async def generate_content(request):
+            requested.append(request.content_type)
+            if request.content_type == ContentType.VIDEO_PACKAGE:
+                return _package_response(json.dumps({"video_script": "s", "caption": "c"}))
+            return ContentResponse(content="single", content_type=request.content_type)
+
+        monkeypatch.setattr(orchestrator, "generate_content", generate_content)
+
+        package = await orchestrator.generate_video_content_package("topic", "instagram", {})
+
+        assert requested == [
+            ContentType.VIDEO_PACKAGE,
+            ContentType.HASHTAGS,
+            ContentType.THUMBNAIL_PROMPT,
+        ]
+        assert package["video_script"].content == "s"
+        assert package["thumbnail_prompt"].content == "single"
+
+    async def test_streaming_batches_all_but_script(self, monkeypatch):
+        """Test streaming sends the script alone and batches the other fields."""
+        orchestrator = AIOrchestrator()
+        requests: list[ContentRequest] = []
+
+        async def generate_content(request):
+            requests.append(request)
+            if request.content_type == ContentType.VIDEO_PACKAGE:
+                fields = {"caption": "c", "hashtags": "#h", "thumbnail_prompt": "t"}
+                return _package_response(json.dumps(fields))
+            return ContentResponse(content="script", content_type=request.content_type)
+
+        monkeypatch.setattr(orchestrator, "generate_content", generate_content)
+
+        items = dict(
+            [
+                item
+                async for item in orchestrator.generate_video_content_package_streaming(
+                    "topic", "instagram", {}
+                )
+            ]
+        )
+
+        assert sorted(r.content_type.value for r in requests) == ["video_package", "video_script"]
+        package_request = next(r for r in requests if r.content_type == ContentType.VIDEO_PACKAGE)
+        assert "video_script" in package_request.additional_context
+        assert set(items) == {"video_script", "caption", "hashtags", "thumbnail_prompt"}
+        assert items["caption"].tokens_used == 42
+
+
+class _FakeStream:
+    """Chat completion stream stub yielding one delta per chunk, then usage."""
+
+    def __init__(self, deltas: list[str]):
+        self.deltas = deltas
+        self.closed = False
+
+    async def __aiter__(self):
+        for delta in self.deltas:
+            choice = SimpleNamespace(delta=SimpleNamespace(content=delta))
+            yield SimpleNamespace(usage=None, choices=[choice])
+        yield SimpleNamespace(usage=SimpleNamespace(total_tokens=42), choices=[])
+
+    async def close(self):
+        self.closed = True
+
+
+class TestChatGPTStreaming:
+    """Tests for reading streamed ChatGPT completions."""
+
+    @staticmethod
+    def _service(monkeypatch, stream: _FakeStream) -> ChatGPTService:
+        async def create(**kwargs):
+            assert kwargs["stream"] is True
+            return stream
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        monkeypatch.setattr(ChatGPTService, "client", property(lambda _self: client))
+        return ChatGPTService()
+
+    async def test_full_stream_reports_usage(self, monkeypatch):
+        """Test a stream read to the end keeps its token usage."""
+        service = self._service(monkeypatch, _FakeStream(["Hello ", "world"]))
+
+        response = await service.generate_content(
+            ContentRequest(ContentType.CAPTION, "topic", "instagram", max_length=280)
+        )
+
+        assert response.content == "Hello world"
+        assert response.tokens_used == 42
+        assert "truncated" not in response.metadata
+
+    async def test_stream_cut_at_max_length(self, monkeypatch):
+        """Test an early stop trims to max_length and flags the missing usage."""
+        stream = _FakeStream(["Hello ", "world", "!"])
+        service = self._service(monkeypatch, stream)
+
+        response = await service.generate_content(
+            ContentRequest(ContentType.CAPTION, "topic", "instagram", max_length=8)
+        )
+
+        assert response.content == "Hello wo"
+        assert response.metadata["truncated"] is True
+        assert stream.closed
+
+
+class TestSharedClient:
+    """Tests for the OpenAI client bound to the shared HTTP client."""
+
+    async def test_client_rebuilt_after_close(self, monkeypatch):
+        """Test a closed shared client is not reused by the cached OpenAI client."""
+        service = ChatGPTService()
+        monkeypatch.setattr(service.settings.ai, "openai_api_key", "sk-test")
+        first = service.client
+        assert service.client is first
+
+        await _http.close_http_client()
+
+        assert service.client is not first
+        assert not service._http_client.is_closed
+        await _http.close_http_client()
+
+
+class _FakeService:
+    """AI service stub with a fixed generate outcome and ping result."""
+
+    def __init__(
+        self,
+        name: str,
+        fails: bool,
+        alive: bool = True,
+        ping_hangs: bool = False,
+        delay: float = 0.0,
+    ):
+        self.service_name = name
+        self.fails = fails
+        self.alive = alive
+        self.ping_hangs = ping_hangs
+        self.delay = delay
+        self.calls = 0
+
+    async def generate_content(self, request):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fails:
+            raise RuntimeError(f"{self.service_name} failed")
+        return ContentResponse(content="ok", content_type=request.content_type)
+
+    async def is_available(self):
+        return True
+
+    async def ping(self):
+        if self.ping_hangs:
+            await asyncio.Event().wait()
+        return self.alive
+
+
+class TestServiceFailures:
+    """Tests for evicting failed services from the availability cache."""
+
+    async def test_race_evicts_dead_service(self):
+        """Test a service that fails and fails its ping is dropped from the cache."""
+        orchestrator = AIOrchestrator()
+        orchestrator.services = {
+            "chatgpt": _FakeService("chatgpt", fails=True, alive=False),
+            "gemini": _FakeService("gemini", fails=True, alive=True),
+            "grok": _FakeService("grok", fails=False),
+        }
+        request = ContentRequest(ContentType.CAPTION, "topic", "instagram")
+
+        response = await orchestrator.generate_content(request)
+
+        assert response.content == "ok"
+        # Eviction runs after the winner is returned
+        await asyncio.gather(*orchestrator._background_tasks)
+        assert await orchestrator.get_available_services() == ["gemini", "grok"]
+
+    async def test_priority_calls_only_first_service(self):
+        """Test priority generation leaves lower-priority services idle on success."""
+        orchestrator = AIOrchestrator()
+        orchestrator.services = {
+            "chatgpt": _FakeService("chatgpt", fails=False),
+            "gemini": _FakeService("gemini", fails=False),
+            "grok": _FakeService("grok", fails=False),
+        }
+        request = ContentRequest(ContentType.CAPTION, "topic", "instagram")
+
+        await orchestrator.generate_content(request)
+
+        assert [s.calls for s in orchestrator.services.values()] == [1, 0, 0]
+
+    async def test_priority_hedges_slow_service(self):
+        """Test the next service starts once the hedge delay passes."""
+        orchestrator = AIOrchestrator()
+        orchestrator._hedge_delay = 0.01
+        orchestrator.services = {
+            "chatgpt": _FakeService("chatgpt", fails=False, delay=10),
+            "gemini": _FakeService("gemini", fails=False),
+            "grok": _FakeService("grok", fails=False),
+        }
+        request = ContentRequest(ContentType.CAPTION, "topic", "instagram")
+
+        response = await asyncio.wait_for(orchestrator.generate_content(request), timeout=1)
+
+        assert response.content == "ok"
+        assert [s.calls for s in orchestrator.services.values()] == [1, 1, 0]
+
+    async def test_hung_ping_does_not_delay_winner(self):
+        """Test the winner is returned without waiting on a failed service's ping."""
+        orchestrator = AIOrchestrator()
+        orchestrator.services = {
+            "chatgpt": _FakeService("chatgpt", fails=True, ping_hangs=True),
+            "grok": _FakeService("grok", fails=False),
+        }
+        await orchestrator.get_available_services()
+        request = ContentRequest(ContentType.CAPTION, "topic", "instagram")
+
+        response = await asyncio.wait_for(orchestrator.generate_content(request), timeout=1)
+
+        assert response.content == "ok"
+        for task in orchestrator._background_tasks:
+            task.cancel()
+
+    async def test_preferred_service_skipped_once_evicted(self):
+        """Test a preferred service dropped from the cache is no longer used."""
+        orchestrator = AIOrchestrator()
+        orchestrator.services = {
+            "chatgpt": _FakeService("chatgpt", fails=False, alive=False),
+            "grok": _FakeService("grok", fails=False),
+        }
+        await orchestrator.ping_services()
+        request = ContentRequest(ContentType.CAPTION, "topic", "instagram")
+
+        response = await orchestrator.generate_content(request, preferred_service="chatgpt")
+
+        assert response.content == "ok"
+        assert orchestrator.services["chatgpt"].calls == 0
+
+    async def test_ping_services(self):
+        """Test ping_services reports and caches only live services."""
+        orchestrator = AIOrchestrator()
+        orchestrator.services = {
+            "chatgpt": _FakeService("chatgpt", fails=False, alive=False),
+            "grok": _FakeService("grok", fails=False),
+        }
+
+        assert await orchestrator.ping_services() == ["grok"]
+        assert await orchestrator.get_available_services() == ["grok"]
@@ -0,0 +1,103 @@
+"""Tests for the content pipeline."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from social_video_automation.ai_services.base import ContentResponse, ContentType
+from social_video_automation.content.pipeline import (
+    ContentPipeline,
+    PipelineResult,
+    parse_hashtags,
+)
+
+
+class TestParseHashtags:
+    """Tests for hashtag parsing."""
+
+    def test_extracts_hashtags(self):
+        """Test hashtags are extracted without the leading '#'."""
+        content = "Try these:\n#PeterMat #AussieSport\n#cricket, #BBL"
+
+        assert parse_hashtags(content) == ["PeterMat", "AussieSport", "cricket", "BBL"]
+
+    def test_plain_words_fallback(self):
+        """Test plain words are used when no #tags are present and bare_words is set."""
+        content = "cricket footy, swimming"
+
+        assert parse_hashtags(content, bare_words=True) == ["cricket", "footy", "swimming"]
+        assert parse_hashtags(content) == []
+
+    def test_prose_without_hashtags(self):
+        """Test prose is not turned into hashtags by default."""
+        assert parse_hashtags("Here are some great tags for your next post.") == []
+
+    def test_bare_words_skip_punctuated_tokens(self):
+        """Test hyphenated and apostrophe tokens are not split into fragments."""
+        content = "gym-life don't AussieSport"
+
+        assert parse_hashtags(content, bare_words=True) == ["AussieSport"]
+
+    def test_limit(self):
+        """Test the number of hashtags is capped."""
+        content = " ".join(f"#tag{i}" for i in range(20))
+
+        assert len(parse_hashtags(content)) == 15
+        assert parse_hashtags(content, limit=3) == ["tag0", "tag1", "tag2"]
+
+
+class TestPipelineResult:
+    """Tests for PipelineResult timing."""
+
+    def test_duration_prefers_monotonic(self):
+        """Test the monotonic timestamps are used when set."""
+        started = datetime(2025, 1, 1)
+        result = PipelineResult("topic", ["instagram"], started_at=started)
+        result.completed_at = started + timedelta(seconds=5)
+        assert result.duration_seconds == 5.0
+
+        result.started_monotonic = 0
+        result.completed_monotonic = 2_500_000_000
+        assert result.duration_seconds == 2.5
+
+
+class _FailingAI:
+    """Streams a script, then fails before the rest of the package arrives."""
+
+    async def generate_video_content_package_streaming(self, **kwargs):
+        yield "video_script", ContentResponse(
+            content=f"script about {kwargs['topic']}", content_type=ContentType.VIDEO_SCRIPT
+        )
+        await asyncio.sleep(0)  # let the render start
+        raise RuntimeError("stream broke")
+
+
+class _SlowVideo:
+    """Video manager whose render never finishes on its own."""
+
+    def __init__(self):
+        self.scripts: list[str] = []
+        self.cancelled = False
+
+    async def generate_for_all_platforms(self, **kwargs):
+        self.scripts.append(kwargs["script"])
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class TestPipelineRun:
+    """Tests for ContentPipeline.run error handling."""
+
+    async def test_stream_error_cancels_video_render(self):
+        """Test a render started from the script is cancelled if the stream fails."""
+        pipeline = ContentPipeline()
+        pipeline.ai = _FailingAI()
+        pipeline.video = video = _SlowVideo()
+
+        result = await pipeline.run("topic", ["instagram"], post_content=False)
+
+        assert video.scripts == ["script about topic"]
+        assert video.cancelled
+        assert result.errors == ["stream broke"]
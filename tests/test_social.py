@@ -1,11 +1,18 @@
 """Tests for social media posting."""
 
+from datetime import datetime
+
+import httpx
 import pytest
 
+from social_video_automation.social import _http
+from social_video_automation.social._http import SocialAPIError
 from social_video_automation.social.base import (
     PostRequest,
     SocialPlatform,
+    to_platform,
 )
+from social_video_automation.social.late import LatePoster
 
 
 class TestPostRequest:
@@ -44,6 +51,7 @@ class TestPostRequest:
         assert "#australian" in full
         assert "#sports" in full
         assert "#cricket" in full
+        assert request.hashtag_str == "#australian #sports #cricket"
 
     def test_request_with_video(self):
         """Test request with video URL."""
@@ -57,6 +65,31 @@ class TestPostRequest:
         assert request.video_url == "https://example.com/video.mp4"
         assert request.youtube_options["title"] == "My Video Title"
 
+    def test_positional_fields_keep_order(self):
+        """Test positional construction binds fields in their original order."""
+        when = datetime(2025, 1, 1, 12, 0)
+        request = PostRequest(
+            [SocialPlatform.TIKTOK], "caption", [], None, None, [], [], when, "UTC"
+        )
+
+        assert request.scheduled_time == when
+        assert request.timezone == "UTC"
+        assert request.scheduled_times == {}
+
+    def test_scheduled_time_for(self):
+        """Test per-platform scheduled times override the default."""
+        default = datetime(2025, 1, 1, 12, 0)
+        tiktok = datetime(2025, 1, 1, 19, 0)
+        request = PostRequest(
+            platforms=[SocialPlatform.INSTAGRAM, SocialPlatform.TIKTOK],
+            caption="Scheduled",
+            scheduled_time=default,
+            scheduled_times={SocialPlatform.TIKTOK: tiktok},
+        )
+
+        assert request.scheduled_time_for(SocialPlatform.INSTAGRAM) == default
+        assert request.scheduled_time_for(SocialPlatform.TIKTOK) == tiktok
+
 
 class TestSocialPlatform:
     """Tests for SocialPlatform enum."""
@@ -69,3 +102,72 @@ class TestSocialPlatform:
         assert SocialPlatform.FACEBOOK.value == "facebook"
         assert SocialPlatform.TWITTER.value == "twitter"
         assert SocialPlatform.LINKEDIN.value == "linkedin"
+
+    def test_to_platform(self):
+        """Test converting platform names."""
+        assert to_platform("tiktok") is SocialPlatform.TIKTOK
+
+        with pytest.raises(ValueError):
+            to_platform("myspace")
+
+
+class TestLateAnalytics:
+    """Tests for batched Late analytics lookups."""
+
+    async def test_get_posts_analytics(self, monkeypatch):
+        """Test results keep request order and failed lookups hold their error."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            post_id = request.url.path.split("/")[3]
+            if post_id == "missing":
+                return httpx.Response(404, json={"error": "not found"})
+            return httpx.Response(200, json={"id": post_id, "views": len(post_id)})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(_http, "_shared_client", client)
+
+        results = await LatePoster().get_posts_analytics(["a1", "missing", "b22"])
+
+        assert results[0] == {"id": "a1", "views": 2}
+        assert isinstance(results[1], SocialAPIError)
+        assert results[1].status_code == 404
+        assert results[2] == {"id": "b22", "views": 3}
+        await client.aclose()
+
+
+class TestLateRetry:
+    """Tests for retrying Late posts."""
+
+    @staticmethod
+    def _poster(monkeypatch, handler) -> LatePoster:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(_http, "_shared_client", client)
+        poster = LatePoster()
+        monkeypatch.setattr(poster.settings.social, "post_retry_base_delay", 0.0)
+        return poster
+
+    async def test_rate_limited_post_retried(self, monkeypatch):
+        """Test a 429 is retried until the post goes through."""
+        statuses = iter([429, 503, 201])
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={})
+
+        poster = self._poster(monkeypatch, handler)
+
+        response = await poster._post_with_retry({}, SocialPlatform.INSTAGRAM)
+
+        assert response.status_code == 201
+
+    async def test_connect_error_not_retried(self, monkeypatch):
+        """Test connection failures are left to the transport's own retries."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        poster = self._poster(monkeypatch, handler)
+
+        with pytest.raises(httpx.ConnectError):
+            await poster._post_with_retry({}, SocialPlatform.INSTAGRAM)
+        assert len(calls) == 1
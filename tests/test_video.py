@@ -1,12 +1,16 @@
 """Tests for video generation."""
 
+import httpx
 import pytest
 
+from social_video_automation.video import _http
 from social_video_automation.video.base import (
     AspectRatio,
     VideoFormat,
     VideoRequest,
+    VideoResult,
 )
+from social_video_automation.video.manager import VideoManager
 
 
 class TestVideoRequest:
@@ -39,6 +43,8 @@ class TestVideoRequest:
         assert request.aspect_ratio == AspectRatio.LANDSCAPE_16_9
         assert request.duration == 60
         assert request.resolution == "1920x1080"
+        assert (request.width, request.height) == (1920, 1080)
+        assert request.aspect_ratio_x == "16x9"
 
 
 class TestAspectRatio:
@@ -60,3 +66,44 @@ class TestVideoFormat:
         assert VideoFormat.MP4.value == "mp4"
         assert VideoFormat.MOV.value == "mov"
         assert VideoFormat.WEBM.value == "webm"
+
+
+class TestDownloadVideo:
+    """Tests for downloading rendered videos."""
+
+    @staticmethod
+    async def _download(monkeypatch, tmp_path, body) -> VideoManager:
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(_http, "_shared_client", client)
+        manager = VideoManager()
+        manager.output_dir = tmp_path
+        result = VideoResult("https://cdn.example/v.mp4", "v1", 30.0, VideoFormat.MP4, "1080x1920")
+        try:
+            await manager._download_video(result)
+        finally:
+            await client.aclose()
+        return manager
+
+    async def test_download_writes_file(self, monkeypatch, tmp_path):
+        """Test the streamed body is written to the output directory."""
+        async def body():
+            yield b"abc"
+            yield b"def"
+
+        await self._download(monkeypatch, tmp_path, body)
+
+        assert (tmp_path / "v1.mp4").read_bytes() == b"abcdef"
+
+    async def test_failed_download_removes_partial_file(self, monkeypatch, tmp_path):
+        """Test a stream that fails midway leaves no partial file."""
+        async def body():
+            yield b"abc"
+            raise httpx.ReadError("connection reset")
+
+        with pytest.raises(httpx.ReadError):
+            await self._download(monkeypatch, tmp_path, body)
+
+        assert not (tmp_path / "v1.mp4").exists()